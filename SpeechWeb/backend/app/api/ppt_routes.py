@@ -5,8 +5,9 @@ import math
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 
 from ..models.ppt import (
     VideoToPPTJobCreateRequest,
@@ -17,10 +18,11 @@ from ..services.video_ppt_service import (
     VideoPPTServiceError,
     create_job,
     get_job,
-    list_completed_jobs_for_browsing,
-    list_jobs,
+    get_job_header,
+    list_jobs_lite,
     process_all_pending_jobs,
     reprocess_job,
+    resolve_ppt_download,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -28,14 +30,11 @@ LOGGER = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/video-to-ppt", tags=["video-to-ppt"])
 
 
-@router.post("/jobs", response_model=VideoToPPTJobDetail, name="create_video_ppt_job")
-def create_video_ppt_job_endpoint(
-    payload: VideoToPPTJobCreateRequest,
-    background_tasks: BackgroundTasks,
-) -> VideoToPPTJobDetail:
+@router.post("/jobs", response_model=VideoToPPTJobDetail, status_code=202, name="create_video_ppt_job")
+def create_video_ppt_job_endpoint(payload: VideoToPPTJobCreateRequest) -> VideoToPPTJobDetail:
     LOGGER.info("API create_video_ppt_job called url=%s job_id=%s", payload.url, payload.job_id)
     try:
-        job = create_job(payload, background_tasks=background_tasks)
+        job = create_job(payload)
         LOGGER.info("Video-to-PPT job accepted job_id=%s status=%s", job.job_id, job.status)
         return job
     except VideoPPTServiceError as exc:
@@ -44,15 +43,17 @@ def create_video_ppt_job_endpoint(
 
 
 @router.get("/jobs", response_model=VideoToPPTJobListResponse, name="list_video_ppt_jobs")
-def list_video_ppt_jobs_endpoint(limit: Optional[int] = Query(default=None, ge=1, le=200)) -> VideoToPPTJobListResponse:
+async def list_video_ppt_jobs_endpoint(limit: Optional[int] = Query(default=None, ge=1, le=200)) -> ORJSONResponse:
     LOGGER.debug("API list_video_ppt_jobs called limit=%s", limit)
-    return list_jobs(limit=limit)
+    result = await run_in_threadpool(list_jobs_lite, limit=limit)
+    # 直接返回响应对象，跳过response_model的二次校验；response_model仅用于文档
+    return ORJSONResponse(content=result)
 
 
 @router.get("/jobs/{job_id}", response_model=VideoToPPTJobDetail, name="get_video_ppt_job")
-def get_video_ppt_job_endpoint(job_id: str) -> VideoToPPTJobDetail:
+async def get_video_ppt_job_endpoint(job_id: str) -> VideoToPPTJobDetail:
     LOGGER.debug("API get_video_ppt_job called job_id=%s", job_id)
-    job = get_job(job_id)
+    job = await run_in_threadpool(get_job, job_id)
     if not job:
         LOGGER.warning("Video-to-PPT job not found job_id=%s", job_id)
         raise HTTPException(status_code=404, detail="Job not found")
@@ -87,7 +88,7 @@ def reprocess_job_endpoint(job_id: str) -> VideoToPPTJobDetail:
 def download_ppt_endpoint(job_id: str):
     """下载PPT文件"""
     LOGGER.info("API download_ppt called job_id=%s", job_id)
-    job = get_job(job_id)
+    job = get_job_header(job_id)
     if not job:
         LOGGER.warning("Job not found job_id=%s", job_id)
         raise HTTPException(status_code=404, detail="Job not found")
@@ -98,21 +99,15 @@ def download_ppt_endpoint(job_id: str):
     if not job.ppt_path:
         raise HTTPException(status_code=404, detail="PPT file not found")
     
-    from ..services.video_ppt_service import resolve_relative_path
-    
-    # 处理相对路径：如果是相对路径，转换为绝对路径
-    ppt_file = resolve_relative_path(job.ppt_path)
-    if not ppt_file or not ppt_file.exists():
+    # 一次stat同时完成存在性检查，并交给FileResponse复用，避免重复系统调用
+    download = resolve_ppt_download(job)
+    if download is None:
         raise HTTPException(status_code=404, detail="PPT file does not exist on disk")
-    
-    # 使用标题作为文件名，如果没有则使用job_id
-    filename = f"{job.title or job_id}.pptx"
-    # 清理文件名中的非法字符
-    import re
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    ppt_file, stat_result, filename = download
     
     return FileResponse(
         path=str(ppt_file),
         filename=filename,
+        stat_result=stat_result,
         media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
     )
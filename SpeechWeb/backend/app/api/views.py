@@ -1,51 +1,160 @@
 from __future__ import annotations
 
+import hashlib
 import math
+import os
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
 import logging
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, Response
 
 from Src.config import VIDEO_TO_PPT_ROOT
-from ..services.video_ppt_service import get_job, list_completed_jobs_for_browsing
+from ..core.cache import TTLCache
+from ..services.video_ppt_service import (
+    browse_cache_version,
+    get_completed_page,
+    get_completed_total,
+    get_player_job,
+)
 
 
 LOGGER = logging.getLogger(__name__)
 router = APIRouter()
 PAGE_SIZE = 24
 
+# 视频根目录与部署根目录在进程生命周期内不变，只解析一次
+_VIDEO_ROOT = Path(VIDEO_TO_PPT_ROOT).resolve()
+_BASE_DIR = _VIDEO_ROOT.parent.parent
+_VIDEO_ROOT_PREFIX = os.path.join(str(_VIDEO_ROOT), "")
+_BASE_DIR_STR = str(_BASE_DIR)
+_RELATIVE_VIDEO_PREFIXES = ("data/video_to_ppt_jobs", "data\\video_to_ppt_jobs")
 
-def _build_page_numbers(current: int, total_pages: int, window: int = 2) -> list[int]:
+# 与main.py中的静态挂载路径保持一致，模板中也直接使用该前缀
+_VIDEO_MOUNT_PATH = "/ppt-videos"
+
+# 浏览页分页结果缓存，键中包含任务表写入版本号，任何进程写入任务后自动失效
+_BROWSE_CACHE = TTLCache(maxsize=256, ttl=30)
+
+# 管理页无服务端数据，只依赖url_for生成的链接，按base_url缓存渲染结果
+_MANAGE_PAGE_CACHE = TTLCache(maxsize=16, ttl=3600)
+
+
+def _cached_browse(
+    version: int, page: int, page_size: int, search_term: str | None, after: int | None = None
+) -> list:
+    # search_term已由调用方规范化，与查询、总数缓存和ETag使用同一个值
+    key = (version, page, page_size, search_term, after)
+    items = _BROWSE_CACHE.get(key)
+    if items is None:
+        items = get_completed_page(page=page, page_size=page_size, search_term=search_term, after=after)
+        _BROWSE_CACHE.set(key, items)
+    return items
+
+
+def _home_etag(version: int, page: int, search_term: str | None, after: int | None = None) -> str:
+    """由任务表写入版本号和请求参数生成浏览页ETag；分页与总数缓存使用同一版本号，
+    返回的页面内容总是不早于ETag对应的数据版本"""
+    raw = f"{version}|{page}|{search_term or ''}|{after or ''}"
+    return '"' + hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest() + '"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _load_home_page(
+    version: int, page: int, search_term: str | None, after: int | None = None
+) -> tuple[int, int, int, list]:
+    """在线程池中执行的数据库部分：返回（总数，总页数，修正后的页码，当前页条目）"""
+    # 总数单独缓存，先计算总页数，避免超出范围时重复查询
+    total = get_completed_total(search_term, version)
+    total_pages = math.ceil(total / PAGE_SIZE) if total > 0 else 0
+    
+    # 如果当前页超出范围，重定向到最后一页
+    if total_pages > 0 and page > total_pages:
+        page = total_pages
+        after = None
+    
+    items = _cached_browse(version, page, PAGE_SIZE, search_term, after)
+    return total, total_pages, page, items
+
+
+@lru_cache(maxsize=4096)
+def _video_url_path(rel_posix: str) -> str:
+    """相对路径到视频URL路径的映射，挂载前缀固定，无需经过url_for遍历路由表"""
+    return f"{_VIDEO_MOUNT_PATH}/{quote(rel_posix)}"
+
+
+def _video_stream_url(request: Request, rel_posix: str) -> str:
+    return request.scope.get("root_path", "") + _video_url_path(rel_posix)
+
+
+def _build_video_entry(request: Request, path_str: str, *, is_primary: bool = False) -> dict[str, str | bool | None]:
+    path = Path(path_str)
+    entry: dict[str, str | bool | None] = {
+        "path": path_str,
+        "label": path.stem or path.name,
+        "filename": path.name,
+        "is_primary": is_primary,
+        "url": None,
+    }
+    # 处理相对路径：如果路径以data/video_to_ppt_jobs开头，说明是相对路径
+    if path_str.startswith(_RELATIVE_VIDEO_PREFIXES):
+        # 转换为绝对路径（纯字符串规范化，不访问磁盘）
+        abs_str = os.path.normpath(os.path.join(_BASE_DIR_STR, path_str))
+    else:
+        # 已经是绝对路径
+        abs_str = os.path.normpath(path_str)
+    
+    # 计算相对于VIDEO_TO_PPT_ROOT的路径：字符串前缀比较，不抛异常
+    if abs_str.startswith(_VIDEO_ROOT_PREFIX):
+        relative_posix = abs_str[len(_VIDEO_ROOT_PREFIX):].replace(os.sep, "/")
+        entry["url"] = _video_stream_url(request, relative_posix)
+    else:
+        LOGGER.warning("Video path %s is outside of %s, cannot build stream URL", path_str, _VIDEO_ROOT)
+    return entry
+
+
+@lru_cache(maxsize=2048)
+def _build_page_numbers(current: int, total_pages: int, window: int = 2) -> tuple[int, ...]:
     if total_pages <= 0:
-        return []
+        return ()
     start = max(1, current - window)
     end = min(total_pages, current + window)
-    return list(range(start, end + 1))
+    return tuple(range(start, end + 1))
 
 
 @router.get("/", name="ppt_video_home", response_class=HTMLResponse)
 @router.get("/ppt_video", name="ppt_video_home_alt", response_class=HTMLResponse)
-def ppt_video_home(
+async def ppt_video_home(
     request: Request,
     q: str | None = Query(default=None, description="关键词检索"),
     page: int = Query(default=1, ge=1, description="页码"),
-) -> HTMLResponse:
+    after: int | None = Query(default=None, ge=1, description="上一页最后一条记录的id（键集分页游标）"),
+) -> Response:
     """PPT视频浏览主页"""
-    search_term = q.strip() if q else None
-    current_page = max(page, 1)
+    # 检索词只规范化一次（压缩空白），查询、总数缓存、分页缓存和ETag都使用该值；
+    # 不转小写：SQLite的LIKE只对ASCII不区分大小写，转换后非ASCII词的查询结果会改变
+    search_term = " ".join(q.split()) if q else None
+    search_term = search_term or None
     
-    result = list_completed_jobs_for_browsing(page=current_page, page_size=PAGE_SIZE, search_term=search_term)
+    # 数据未变化时直接返回304，跳过分页查询和模板渲染
+    version = await run_in_threadpool(browse_cache_version)
+    etag = _home_etag(version, page, search_term, after)
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=cache_headers)
     
-    total = result["total"]
-    items = result["items"]
-    total_pages = result["total_pages"]
-    
-    # 如果当前页超出范围，重定向到最后一页
-    if total_pages > 0 and current_page > total_pages:
-        current_page = total_pages
-        result = list_completed_jobs_for_browsing(page=current_page, page_size=PAGE_SIZE, search_term=search_term)
-        items = result["items"]
+    total, total_pages, current_page, items = await run_in_threadpool(
+        _load_home_page, version, max(page, 1), search_term, after
+    )
     
     start_index = ((current_page - 1) * PAGE_SIZE) + 1 if total else 0
     end_index = min(start_index + len(items) - 1, total) if total else 0
@@ -65,67 +174,46 @@ def ppt_video_home(
             "has_next": current_page < total_pages,
             "prev_page": current_page - 1 if current_page > 1 else None,
             "next_page": current_page + 1 if current_page < total_pages else None,
+            # 下一页链接带上当前页最后一条记录的id，顺序翻页时走键集分页
+            "next_cursor": items[-1].id if items and current_page < total_pages else None,
             "page_size": PAGE_SIZE,
             "result_range": (start_index, end_index),
         },
+        headers=cache_headers,
     )
 
 
 @router.get("/ppt_video/play/{job_id}", name="ppt_video_player", response_class=HTMLResponse)
-def ppt_video_player(job_id: str, request: Request) -> HTMLResponse:
+async def ppt_video_player(job_id: str, request: Request) -> HTMLResponse:
     """PPT视频播放页"""
-    job = get_job(job_id)
+    job = await run_in_threadpool(get_player_job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="视频任务不存在")
 
     if job.status != "completed":
         raise HTTPException(status_code=400, detail=f"视频任务未完成（当前状态：{job.status}）")
 
-    root_path = Path(VIDEO_TO_PPT_ROOT).resolve()
-    base_dir = root_path.parent.parent  # 获取部署根目录
-
-    def _build_video_entry(path_str: str, *, is_primary: bool = False) -> dict[str, str | bool | None]:
-        entry: dict[str, str | bool | None] = {
-            "path": path_str,
-            "label": Path(path_str).stem or Path(path_str).name,
-            "filename": Path(path_str).name,
-            "is_primary": is_primary,
-            "url": None,
-        }
-        try:
-            # 处理相对路径：如果路径以data/video_to_ppt_jobs开头，说明是相对路径
-            if path_str.startswith("data/video_to_ppt_jobs") or path_str.startswith("data\\video_to_ppt_jobs"):
-                # 转换为绝对路径
-                abs_path = (base_dir / path_str).resolve()
-            else:
-                # 已经是绝对路径
-                abs_path = Path(path_str).resolve()
-            
-            # 计算相对于VIDEO_TO_PPT_ROOT的路径
-            relative_path = abs_path.relative_to(root_path)
-            entry["url"] = request.url_for("ppt_videos", path=relative_path.as_posix())
-        except ValueError:
-            LOGGER.warning("Video path %s is outside of %s, cannot build stream URL", path_str, root_path)
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.warning("Failed to build video entry for %s: %s", path_str, exc)
-        return entry
-
     video_entries: list[dict[str, str | bool | None]] = []
 
-    if job.video_files:
-        for idx, path_str in enumerate(job.video_files):
-            video_entries.append(_build_video_entry(path_str, is_primary=(idx == 0)))
+    if job.video_entries:
+        # 任务完成时已排序并计算好相对路径，这里只需生成URL
+        for idx, item in enumerate(job.video_entries):
+            video_entries.append(
+                {
+                    "path": item.path,
+                    "label": item.label,
+                    "filename": item.filename,
+                    "is_primary": idx == 0,
+                    "url": _video_stream_url(request, item.rel_path) if item.rel_path else None,
+                }
+            )
+    elif job.video_files:
+        # 旧任务未保存预排序结果：按label排序后第一个为primary
+        sorted_files = sorted(job.video_files, key=lambda p: Path(p).stem or Path(p).name)
+        for idx, path_str in enumerate(sorted_files):
+            video_entries.append(_build_video_entry(request, path_str, is_primary=(idx == 0)))
     elif job.video_path:
-        video_entries.append(_build_video_entry(job.video_path, is_primary=True))
-
-    # 按label字符串排序
-    video_entries.sort(key=lambda x: str(x.get("label", "")))
-    
-    # 重新设置第一个为primary
-    if video_entries:
-        for entry in video_entries:
-            entry["is_primary"] = False
-        video_entries[0]["is_primary"] = True
+        video_entries.append(_build_video_entry(request, job.video_path, is_primary=True))
 
     video_stream_url: str | None = None
     for entry in video_entries:
@@ -148,9 +236,12 @@ def ppt_video_player(job_id: str, request: Request) -> HTMLResponse:
 @router.get("/manage/ppt", name="manage_video_to_ppt", response_class=HTMLResponse)
 def manage_video_to_ppt(request: Request) -> HTMLResponse:
     """视频转PPT管理页面"""
-    templates = request.app.state.templates
-    return templates.TemplateResponse(
-        "manage/video_to_ppt.html",
-        {"request": request},
-    )
+    cache_key = str(request.base_url)
+    content = _MANAGE_PAGE_CACHE.get(cache_key)
+    if content is None:
+        # 若日后加入CSRF令牌或用户相关数据，需改回每次渲染
+        template = request.app.state.templates.get_template("manage/video_to_ppt.html")
+        content = template.render(request=request).encode("utf-8")
+        _MANAGE_PAGE_CACHE.set(cache_key, content)
+    return HTMLResponse(content=content, headers={"Cache-Control": "public, max-age=300"})
 
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import queue
 from contextlib import contextmanager
 from typing import Iterator
 
 from Src.database import SpeechDatabase
 
+# 连接池大小：超出时多余的连接在归还时直接关闭
+POOL_SIZE = 8
+
+_pool: "queue.LifoQueue[SpeechDatabase]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
 
 @contextmanager
 def get_database() -> Iterator[SpeechDatabase]:
-    """生成一个数据库连接，确保使用后关闭。"""
-    db = SpeechDatabase()
+    """从连接池取出一个数据库连接，使用后归还；池中无可用连接时新建。"""
+    try:
+        db = _pool.get_nowait()
+    except queue.Empty:
+        db = SpeechDatabase(check_same_thread=False)
     try:
         yield db
     finally:
-        db.close()
-
+        # 回滚未提交的事务，避免把脏状态带给下一个使用者
+        if db.connection.in_transaction:
+            db.connection.rollback()
+        try:
+            _pool.put_nowait(db)
+        except queue.Full:
+            db.close()
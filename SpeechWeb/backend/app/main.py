@@ -1,22 +1,68 @@
 from __future__ import annotations
 
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from starlette.responses import Response
+from starlette.types import Scope
 
 from .api import ppt_routes
 from .api import views as view_routes
-from Src.config import VIDEO_TO_PPT_ROOT
+from .services.video_ppt_service import start_job_worker, stop_job_worker, warm_up_pipeline
+from Src.config import TEMPLATE_AUTO_RELOAD, VIDEO_TO_PPT_ROOT
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 FRONTEND_DIR = BASE_DIR / "frontend"
+TEMPLATE_CACHE_DIR = BASE_DIR / ".jinja_cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """为任务产物（视频、截图）附加缓存头；Range、ETag与sendfile由StaticFiles/FileResponse处理。
+
+    重新处理任务会在同一目录下以相同文件名重新生成截图和视频，因此默认no-cache：
+    浏览器可以缓存，但每次使用前用ETag/Last-Modified重新验证，未变化时只返回304。
+    """
+
+    def __init__(self, *args, cache_control: str = "public, no-cache", **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers.setdefault("Cache-Control", self.cache_control)
+        return response
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 预先创建pipeline，再启动常驻任务执行线程并处理上次退出时遗留的pending任务
+    warm_up_pipeline()
+    start_job_worker()
+    yield
+    stop_job_worker()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="VideoPPT Service", version="1.0.0")
+    app = FastAPI(
+        title="VideoPPT Service",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -27,6 +73,10 @@ def create_app() -> FastAPI:
     )
 
     templates = Jinja2Templates(directory=str(FRONTEND_DIR / "templates"))
+    # 编译结果持久化到磁盘，重启及多worker间共享，避免冷启动时重复编译模板
+    TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
+    templates.env.auto_reload = TEMPLATE_AUTO_RELOAD
     app.state.templates = templates
 
     static_dir = FRONTEND_DIR / "static"
@@ -36,7 +86,11 @@ def create_app() -> FastAPI:
     # 挂载video_to_ppt_jobs目录用于访问视频和截图
     ppt_videos_dir = Path(VIDEO_TO_PPT_ROOT)
     ppt_videos_dir.mkdir(parents=True, exist_ok=True)
-    app.mount("/ppt-videos", StaticFiles(directory=str(ppt_videos_dir)), name="ppt_videos")
+    app.mount(
+        "/ppt-videos",
+        CachedStaticFiles(directory=str(ppt_videos_dir), check_dir=False),
+        name="ppt_videos",
+    )
 
     app.include_router(view_routes.router)
     app.include_router(ppt_routes.router)
@@ -1,6 +1,7 @@
 # Models Package - PPT only version
 from .ppt import (
     SlideInfoModel,
+    VideoEntryModel,
     VideoToPPTJobCreateRequest,
     VideoToPPTJobDetail,
     VideoToPPTJobListResponse,
@@ -9,6 +10,7 @@ from .ppt import (
 
 __all__ = [
     "SlideInfoModel",
+    "VideoEntryModel",
     "VideoToPPTJobCreateRequest",
     "VideoToPPTJobDetail",
     "VideoToPPTJobListResponse",
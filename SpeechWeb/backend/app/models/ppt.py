@@ -3,10 +3,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import AnyHttpUrl, BaseModel, Field
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
+
+# 响应模型只由服务层根据数据库记录构建，创建后不再修改
+_RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class SlideInfoModel(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     index: int = Field(..., ge=1)
     filename: str
     path: str
@@ -17,7 +22,18 @@ class SlideInfoModel(BaseModel):
     similarity: Optional[float] = Field(None, ge=0.0, le=1.0)
 
 
+class VideoEntryModel(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
+    path: str
+    label: str
+    filename: str
+    rel_path: Optional[str] = None  # 相对于VIDEO_TO_PPT_ROOT的posix路径，无法播放时为None
+
+
 class VideoToPPTJobCreateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore", str_strip_whitespace=True)
+
     url: AnyHttpUrl
     title: Optional[str] = None
     subtitle: Optional[str] = None
@@ -43,9 +59,11 @@ class VideoToPPTJobCreateRequest(BaseModel):
 
 
 class VideoToPPTJobSummary(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: int
     job_id: str
-    url: AnyHttpUrl
+    url: str  # 创建任务时已校验，读取时不再重复解析URL
     title: Optional[str] = None
     subtitle: Optional[str] = None
     status: str
@@ -58,6 +76,7 @@ class VideoToPPTJobSummary(BaseModel):
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     ppt_path: Optional[str] = None
+    safe_filename: Optional[str] = None
 
 
 class VideoToPPTJobDetail(VideoToPPTJobSummary):
@@ -69,6 +88,7 @@ class VideoToPPTJobDetail(VideoToPPTJobSummary):
     file_pattern: Optional[str] = None
     video_path: Optional[str] = None
     video_files: Optional[List[str]] = None
+    video_entries: Optional[List[VideoEntryModel]] = None
     job_dir: Optional[str] = None
     slides_json_path: Optional[str] = None
     screenshots_dir: Optional[str] = None
@@ -81,5 +101,7 @@ class VideoToPPTJobDetail(VideoToPPTJobSummary):
 
 
 class VideoToPPTJobListResponse(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     total: int
     items: List[VideoToPPTJobSummary]
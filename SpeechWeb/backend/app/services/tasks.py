@@ -0,0 +1,20 @@
+"""Celery tasks for running video-to-PPT jobs outside the web process.
+
+Only imported when ``CELERY_BROKER_URL`` is configured. Start a worker with::
+
+    celery -A SpeechWeb.backend.app.services.tasks worker --concurrency=1
+"""
+from __future__ import annotations
+
+from celery import Celery
+
+from Src.config import CELERY_BROKER_URL
+
+celery_app = Celery("v2p", broker=CELERY_BROKER_URL)
+
+
+@celery_app.task(name="video_to_ppt.process_job")
+def process_job(job_id: str) -> None:
+    from .video_ppt_service import run_job_by_id
+
+    run_job_by_id(job_id)
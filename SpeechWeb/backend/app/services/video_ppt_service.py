@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from fastapi import BackgroundTasks
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
-from Src.config import BBDOWN_EXECUTABLE, VIDEO_TO_PPT_ROOT, YTDLP_EXECUTABLE
+from Src.config import (
+    BASE_DIR,
+    BBDOWN_EXECUTABLE,
+    CELERY_BROKER_URL,
+    VIDEO_HWACCEL,
+    VIDEO_TO_PPT_ROOT,
+    YTDLP_EXECUTABLE,
+)
 from Src.video_to_ppt import PipelineConfig, PipelineOptions, VideoToPPTError, VideoToPPTPipeline
 
+from ..core.cache import TTLCache
 from ..core.db import get_database
 from ..models.ppt import (
     SlideInfoModel,
+    VideoEntryModel,
     VideoToPPTJobCreateRequest,
     VideoToPPTJobDetail,
-    VideoToPPTJobListResponse,
     VideoToPPTJobSummary,
 )
 
@@ -27,7 +39,39 @@ LOGGER = logging.getLogger(__name__)
 # 使用最简单的参数，避免版本兼容问题
 DEFAULT_BBDOWN_ARGS: List[str] = []
 
+# 已完成任务总数缓存 {(版本号, search_term): total}；键中含任务表写入版本号，任何进程写入后自动失效
+_total_cache = TTLCache(maxsize=256, ttl=300)
+
+# 单个任务查询缓存 {(job_id, kind): model}；只缓存终态任务，
+# 运行中任务的状态可能由其他进程（Celery worker）更新，不缓存
+_job_cache = TTLCache(maxsize=1024, ttl=10)
+_JOB_CACHE_KINDS = ("detail", "player")
+_CACHEABLE_STATUSES = frozenset({"completed", "failed"})
+
+# 浏览页并发读取截图清单（I/O密集），单个任务查询仍同步读取
+_SLIDES_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="slides-loader")
+
+
+def browse_cache_version() -> int:
+    """返回浏览页缓存版本号：任务表的写入版本号，由数据库触发器维护，
+    Celery worker等其他进程写入后同样变化，单次主键查询"""
+    with get_database() as db:
+        return db.get_video_ppt_jobs_version()
+
+
+def _remember_job(job_id: str, kind: str, job: VideoToPPTJobDetail) -> VideoToPPTJobDetail:
+    if job.status in _CACHEABLE_STATUSES:
+        _job_cache.set((job_id, kind), job)
+    return job
+
 
+def _invalidate_job_cache(job_id: str) -> None:
+    """任务记录写入后调用，清除该任务的查询缓存"""
+    for kind in _JOB_CACHE_KINDS:
+        _job_cache.pop((job_id, kind))
+
+
+@lru_cache(maxsize=4096)
 def resolve_relative_path(path_str: Optional[str]) -> Optional[Path]:
     """
     将相对路径转换为绝对路径
@@ -37,27 +81,83 @@ def resolve_relative_path(path_str: Optional[str]) -> Optional[Path]:
     if not path_str:
         return None
     
-    from Src.config import BASE_DIR
     path = Path(path_str)
     if not path.is_absolute():
         path = BASE_DIR / path
     return path
 
 
+_BASE_DIR_PREFIX = str(BASE_DIR).replace("\\", "/").rstrip("/") + "/"
+
+
+def _to_relative_path(abs_path: Path) -> str:
+    """将绝对路径转换为相对路径（相对于部署根目录），用于写入数据库；不在部署根目录下时返回原路径"""
+    path_str = str(abs_path).replace("\\", "/")
+    if path_str.startswith(_BASE_DIR_PREFIX):
+        return path_str[len(_BASE_DIR_PREFIX):]
+    return path_str
+
+
+# 文件名非法字符替换表，str.translate单次遍历完成替换
+_ILLEGAL_FILENAME_TABLE = dict.fromkeys(map(ord, '<>:"/\\|?*'), ord("_"))
+
+
+def safe_download_filename(title: Optional[str], job_id: str) -> str:
+    """生成PPT下载文件名：优先使用标题，并清理文件名中的非法字符"""
+    filename = f"{title or job_id}.pptx"
+    return filename.translate(_ILLEGAL_FILENAME_TABLE)
+
+
+def resolve_ppt_download(job: VideoToPPTJobSummary) -> Optional[Tuple[Path, os.stat_result, str]]:
+    """定位任务的PPT文件，返回（文件路径，stat结果，下载文件名）；文件不存在时返回None"""
+    ppt_file = resolve_relative_path(job.ppt_path)
+    if not ppt_file:
+        return None
+    try:
+        stat_result = os.stat(ppt_file)
+    except OSError:
+        return None
+    filename = job.safe_filename or safe_download_filename(job.title, job.job_id)
+    return ppt_file, stat_result, filename
+
+
 class VideoPPTServiceError(RuntimeError):
     """Raised when the video-to-PPT workflow fails."""
 
 
-@lru_cache()
+_pipeline: Optional[VideoToPPTPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
 def get_pipeline() -> VideoToPPTPipeline:
-    config = PipelineConfig(
-        bbdown_executable=BBDOWN_EXECUTABLE,
-        workspace_root=VIDEO_TO_PPT_ROOT,
-        ytdlp_executable=YTDLP_EXECUTABLE,  # 添加yt-dlp配置
-        default_bbdown_args=DEFAULT_BBDOWN_ARGS,
-        default_ytdlp_args=[],  # yt-dlp默认参数（如需要可配置）
-    )
-    return VideoToPPTPipeline(config=config)
+    global _pipeline
+    # 已创建时直接返回，不再经过锁
+    pipeline = _pipeline
+    if pipeline is not None:
+        return pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            config = PipelineConfig(
+                bbdown_executable=BBDOWN_EXECUTABLE,
+                workspace_root=VIDEO_TO_PPT_ROOT,
+                ytdlp_executable=YTDLP_EXECUTABLE,  # 添加yt-dlp配置
+                default_bbdown_args=DEFAULT_BBDOWN_ARGS,
+                default_ytdlp_args=[],  # yt-dlp默认参数（如需要可配置）
+                video_hwaccel=VIDEO_HWACCEL or None,
+            )
+            _pipeline = VideoToPPTPipeline(config=config)
+        return _pipeline
+
+
+def warm_up_pipeline() -> None:
+    """服务启动时预先创建pipeline，避免首个任务承担初始化开销；任务由Celery执行时跳过"""
+    if CELERY_BROKER_URL:
+        return
+    try:
+        get_pipeline()
+    except FileNotFoundError as exc:
+        # 与任务执行时一致：下载工具未配置时仅记录，任务运行时会标记为失败
+        LOGGER.warning("Video-to-PPT pipeline not available: %s", exc)
 
 
 def _generate_job_id() -> str:
@@ -70,105 +170,161 @@ def _to_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
-        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+        # 数据库中为"YYYY-MM-DD HH:MM:SS"，fromisoformat可直接解析且远快于strptime
+        return datetime.fromisoformat(value)
     except ValueError:
         LOGGER.debug("Failed to parse datetime string: %s", value)
         return None
 
 
-def _decode_extra_args(value: Optional[str]) -> Optional[List[str]]:
+def _decode_list(value: Optional[str], field_name: str) -> Optional[List[str]]:
+    """解码数据库中以JSON数组保存的字符串列表；失败时只记录字段名，不输出（可能很大的）原始内容"""
     if not value:
         return None
     try:
-        data = json.loads(value)
-        if isinstance(data, list):
-            return [str(item) for item in data]
-    except json.JSONDecodeError:
-        LOGGER.warning("Failed to decode extra args JSON: %s", value)
+        data = orjson.loads(value)
+    except orjson.JSONDecodeError as exc:
+        LOGGER.warning("Failed to decode %s JSON: %s", field_name, exc)
+        return None
+    if isinstance(data, list):
+        return [str(item) for item in data]
     return None
 
 
-def _decode_command(value: Optional[str]) -> Optional[List[str]]:
-    if not value:
-        return None
-    try:
-        data = json.loads(value)
-        if isinstance(data, list):
-            return [str(item) for item in data]
-    except json.JSONDecodeError:
-        LOGGER.warning("Failed to decode command JSON: %s", value)
-    return None
+_decode_extra_args = partial(_decode_list, field_name="extra_download_args")
+_decode_command = partial(_decode_list, field_name="command")
+_decode_video_files = partial(_decode_list, field_name="video_files")
 
 
-def _decode_video_files(value: Optional[str]) -> Optional[List[str]]:
+def _decode_video_entries(value: Optional[str]) -> Optional[List[VideoEntryModel]]:
     if not value:
         return None
     try:
-        data = json.loads(value)
+        data = orjson.loads(value)
         if isinstance(data, list):
-            return [str(item) for item in data]
-    except json.JSONDecodeError:
-        LOGGER.warning("Failed to decode video files JSON: %s", value)
+            return [VideoEntryModel(**item) for item in data]
+    except (TypeError, ValueError) as exc:
+        LOGGER.warning("Failed to decode video_entries JSON: %s", exc)
     return None
 
 
-def _row_to_summary(row: Dict[str, Any]) -> VideoToPPTJobSummary:
-    return VideoToPPTJobSummary(
-        id=row["id"],
-        job_id=row["job_id"],
-        url=row["url"],
-        title=row.get("title"),
-        subtitle=row.get("subtitle"),
-        status=row.get("status", "pending"),
-        slide_count=row.get("slide_count"),
-        image_format=row.get("image_format"),
-        image_quality=row.get("image_quality"),
-        created_at=_to_datetime(row.get("created_at")),
-        updated_at=_to_datetime(row.get("updated_at")),
-        started_at=_to_datetime(row.get("started_at")),
-        completed_at=_to_datetime(row.get("completed_at")),
-        error_message=row.get("error_message"),
-        ppt_path=row.get("ppt_path"),
-    )
+def _video_label(video_path: Path) -> str:
+    return video_path.stem or video_path.name
 
 
-def _load_slides(slides_json_path: Optional[str]) -> Optional[List[SlideInfoModel]]:
-    path = resolve_relative_path(slides_json_path)
-    if not path or not path.exists():
-        return None
+def _build_video_entries(video_paths: List[Path], to_relative: Callable[[Path], str]) -> List[Dict[str, Optional[str]]]:
+    """任务完成时预先计算播放页的视频列表，video_paths需已按label排序，第一项即为主视频"""
+    video_root = Path(VIDEO_TO_PPT_ROOT).resolve()
+    entries: List[Dict[str, Optional[str]]] = []
+    for video_path in video_paths:
+        try:
+            rel_path: Optional[str] = video_path.resolve().relative_to(video_root).as_posix()
+        except ValueError:
+            LOGGER.warning("Video path %s is outside of %s, cannot build stream URL", video_path, video_root)
+            rel_path = None
+        entries.append(
+            {
+                "path": to_relative(video_path),
+                "label": _video_label(video_path),
+                "filename": video_path.name,
+                "rel_path": rel_path,
+            }
+        )
+    return entries
+
+
+# 摘要列在所有查询中都会选出，可直接按列名取值，sqlite3.Row无需先转换为dict
+JobRow = Union[sqlite3.Row, Dict[str, Any]]
+
+
+def _build_common_fields(row: JobRow) -> Dict[str, Any]:
+    """摘要与详情共用的字段，时间字段只解析一次"""
+    return {
+        "id": row["id"],
+        "job_id": row["job_id"],
+        "url": row["url"],
+        "title": row["title"],
+        "subtitle": row["subtitle"],
+        "status": row["status"] or "pending",
+        "slide_count": row["slide_count"],
+        "image_format": row["image_format"],
+        "image_quality": row["image_quality"],
+        "created_at": _to_datetime(row["created_at"]),
+        "updated_at": _to_datetime(row["updated_at"]),
+        "started_at": _to_datetime(row["started_at"]),
+        "completed_at": _to_datetime(row["completed_at"]),
+        "error_message": row["error_message"],
+        "ppt_path": row["ppt_path"],
+        "safe_filename": row["safe_filename"],
+    }
+
+
+def _row_to_summary(row: JobRow) -> VideoToPPTJobSummary:
+    return VideoToPPTJobSummary(**_build_common_fields(row))
+
+
+_SLIDE_LIST_ADAPTER = TypeAdapter(List[SlideInfoModel])
+
+
+@lru_cache(maxsize=512)
+def _parse_slides_file(path_str: str, mtime_ns: int) -> Optional[Tuple[SlideInfoModel, ...]]:
+    """解析截图清单；已完成任务的清单不再变化，按（路径，mtime）缓存解析结果"""
+    path = Path(path_str)
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
     except Exception as exc:  # noqa: BLE001
         LOGGER.warning("Failed to read slides JSON %s: %s", path, exc)
         return None
     slides = data.get("slides")
     if not isinstance(slides, list):
         return None
-    items: List[SlideInfoModel] = []
-    for slide in slides:
-        try:
-            items.append(
-                SlideInfoModel(
-                    index=slide.get("index"),
-                    filename=slide.get("filename"),
-                    path=slide.get("path"),
-                    timestamp_seconds=slide.get("timestamp_seconds", 0.0),
-                    timestamp_text=slide.get("timestamp", ""),
-                    width=slide.get("width", 0),
-                    height=slide.get("height", 0),
-                    similarity=slide.get("similarity"),
-                )
-            )
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.debug("Failed to parse slide entry %s: %s", slide, exc)
-    return items or None
+    try:
+        raw_items = [
+            {
+                "index": slide.get("index"),
+                "filename": slide.get("filename"),
+                "path": slide.get("path"),
+                "timestamp_seconds": slide.get("timestamp_seconds", 0.0),
+                "timestamp_text": slide.get("timestamp", ""),
+                "width": slide.get("width", 0),
+                "height": slide.get("height", 0),
+                "similarity": slide.get("similarity"),
+            }
+            for slide in slides
+        ]
+    except AttributeError:
+        LOGGER.warning("Malformed slide entries in %s", path)
+        return None
+    try:
+        # 整个列表一次校验；清单中有非法条目时才逐条校验并跳过
+        items = _SLIDE_LIST_ADAPTER.validate_python(raw_items)
+    except ValidationError:
+        items = []
+        for raw in raw_items:
+            try:
+                items.append(SlideInfoModel(**raw))
+            except ValidationError as exc:
+                LOGGER.debug("Failed to parse slide entry %s: %s", raw, exc)
+    return tuple(items) or None
+
+
+def _load_slides(slides_json_path: Optional[str]) -> Optional[List[SlideInfoModel]]:
+    path = resolve_relative_path(slides_json_path)
+    if not path:
+        return None
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    slides = _parse_slides_file(str(path), mtime_ns)
+    return list(slides) if slides else None
 
 
 def _row_to_detail(row: Dict[str, Any]) -> VideoToPPTJobDetail:
-    summary = _row_to_summary(row)
-    slides = _load_slides(row.get("slides_json_path")) if summary.status == "completed" else None
+    common = _build_common_fields(row)
+    slides = _load_slides(row.get("slides_json_path")) if common["status"] == "completed" else None
     return VideoToPPTJobDetail(
-        **summary.dict(),
+        **common,
         similarity_threshold=row.get("similarity_threshold"),
         min_interval_seconds=row.get("min_interval_seconds"),
         skip_first_seconds=row.get("skip_first_seconds"),
@@ -185,6 +341,35 @@ def _row_to_detail(row: Dict[str, Any]) -> VideoToPPTJobDetail:
         video_duration_seconds=row.get("video_duration_seconds"),
         fps=row.get("fps"),
         video_files=_decode_video_files(row.get("video_files")),
+        video_entries=_decode_video_entries(row.get("video_entries_json")),
+        slides=slides,
+    )
+
+
+def _status_counts(cursor: Any) -> Dict[str, int]:
+    """单次查询pending/running任务数量（走部分索引）"""
+    counts = {"pending": 0, "running": 0}
+    rows = cursor.execute(
+        "SELECT status, COUNT(*) AS count FROM video_ppt_jobs "
+        "WHERE status IN ('pending', 'running') GROUP BY status"
+    ).fetchall()
+    for row in rows:
+        counts[row["status"]] = row["count"]
+    return counts
+
+
+def _has_running_job(cursor: Any) -> bool:
+    """是否存在运行中的任务：命中第一行即返回，无需计数"""
+    return cursor.execute("SELECT 1 FROM video_ppt_jobs WHERE status = 'running' LIMIT 1").fetchone() is not None
+
+
+def _row_to_listing_item(row: JobRow, slides: Optional[List[SlideInfoModel]]) -> VideoToPPTJobDetail:
+    """浏览页条目：只填充列表展示需要的字段，不解码command/video_files等JSON列"""
+    return VideoToPPTJobDetail(
+        **_build_common_fields(row),
+        slides_json_path=row["slides_json_path"],
+        video_duration_seconds=row["video_duration_seconds"],
+        fps=row["fps"],
         slides=slides,
     )
 
@@ -192,16 +377,14 @@ def _row_to_detail(row: Dict[str, Any]) -> VideoToPPTJobDetail:
 def process_all_pending_jobs() -> Dict[str, Any]:
     """批量处理所有pending任务"""
     with get_database() as db:
-        cursor = db.connection.cursor()
-        row = cursor.execute("SELECT COUNT(*) as count FROM video_ppt_jobs WHERE status = 'pending'").fetchone()
-        pending_count = row["count"] if row else 0
+        counts = _status_counts(db.connection.cursor())
+        pending_count = counts["pending"]
         
         if pending_count == 0:
             return {"message": "No pending jobs to process", "count": 0}
         
         # 检查是否有运行中的任务
-        row = cursor.execute("SELECT COUNT(*) as count FROM video_ppt_jobs WHERE status = 'running'").fetchone()
-        has_running = row["count"] > 0 if row else False
+        has_running = counts["running"] > 0
         
         if has_running:
             return {"message": f"{pending_count} jobs already queued, will process automatically", "count": pending_count}
@@ -234,102 +417,226 @@ def reprocess_job(job_id: str) -> VideoToPPTJobDetail:
             video_path=None,
             job_dir=None,
         )
+        _invalidate_job_cache(job_id)
         
-        # 检查是否有运行中的任务
-        cursor = db.connection.cursor()
-        row = cursor.execute("SELECT COUNT(*) as count FROM video_ppt_jobs WHERE status = 'running'").fetchone()
-        has_running = row["count"] > 0 if row else False
-        
-        if not has_running:
-            # 没有运行中的任务，立即启动
-            _process_next_pending_job()
+        # 通知执行器；已有运行中的任务时会在其完成后按顺序处理
+        _process_next_pending_job()
         
         # 返回更新后的任务详情
         updated_job = db.get_video_ppt_job_by_job_id(job_id)
         return _row_to_detail(updated_job)
 
 
-def list_jobs(limit: Optional[int] = None) -> VideoToPPTJobListResponse:
-    LOGGER.debug("Listing video-to-PPT jobs limit=%s", limit)
-    with get_database() as db:
-        rows = db.list_video_ppt_jobs(limit=limit)
-    items = [_row_to_summary(row) for row in rows]
-    return VideoToPPTJobListResponse(total=len(items), items=items)
+# trigram分词下少于3个字符的词无法命中索引
+_FTS_MIN_TERM_LENGTH = 3
+
+
+def _fts_match_expression(terms: List[str]) -> str:
+    """将检索词转换为FTS5 MATCH表达式：各词作为短语AND组合"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
 
+def _completed_where_clause(search_term: Optional[str], fts_enabled: bool = False) -> Tuple[str, List[Any]]:
+    """构建已完成任务浏览查询的WHERE条件及参数
+
+    检索词按空白拆分后AND组合：长度足够的词走FTS5索引，其余（或未启用FTS时全部）逐词LIKE匹配。
+    """
+    where_clause = "WHERE status = 'completed'"
+    params: List[Any] = []
+    if not search_term:
+        return where_clause, params
+
+    fts_terms: List[str] = []
+    like_terms: List[str] = []
+    for term in search_term.split():
+        if fts_enabled and len(term) >= _FTS_MIN_TERM_LENGTH:
+            fts_terms.append(term)
+        else:
+            like_terms.append(term)
+
+    if fts_terms:
+        where_clause += " AND id IN (SELECT rowid FROM video_ppt_jobs_fts WHERE video_ppt_jobs_fts MATCH ?)"
+        params.append(_fts_match_expression(fts_terms))
+    for term in like_terms:
+        where_clause += " AND (title LIKE ? OR subtitle LIKE ? OR url LIKE ?)"
+        search_pattern = f"%{term}%"
+        params.extend([search_pattern, search_pattern, search_pattern])
+    return where_clause, params
+
+
+def get_completed_total(search_term: Optional[str] = None, version: Optional[int] = None) -> int:
+    """获取已完成任务总数，按任务表写入版本号缓存；version由调用方传入时不再单独查询版本号"""
+    if version is None:
+        version = browse_cache_version()
+    key = (version, search_term)
+    total = _total_cache.get(key)
+    if total is not None:
+        return total
 
-def list_completed_jobs_for_browsing(page: int = 1, page_size: int = 20, search_term: Optional[str] = None) -> Dict[str, Any]:
-    """获取已完成任务列表用于浏览页面展示"""
     with get_database() as db:
+        where_clause, params = _completed_where_clause(search_term, db.fts_enabled)
         cursor = db.connection.cursor()
-        
-        # 构建查询条件
-        where_clause = "WHERE status = 'completed'"
-        params = []
-        
-        if search_term:
-            where_clause += " AND (title LIKE ? OR subtitle LIKE ? OR url LIKE ?)"
-            search_pattern = f"%{search_term}%"
-            params.extend([search_pattern, search_pattern, search_pattern])
-        
-        # 获取总数
         count_query = f"SELECT COUNT(*) as total FROM video_ppt_jobs {where_clause}"
         total = cursor.execute(count_query, params).fetchone()["total"]
-        
-        # 分页查询
-        offset = (page - 1) * page_size
-        list_query = f"""
-            SELECT * FROM video_ppt_jobs {where_clause}
-            ORDER BY completed_at DESC
-            LIMIT ? OFFSET ?
-        """
-        rows = cursor.execute(list_query, params + [page_size, offset]).fetchall()
-        
-        items = [_row_to_detail(dict(row)) for row in rows]
-        
-        return {
-            "total": total,
-            "items": items,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size if total > 0 else 0,
-        }
+
+    _total_cache.set(key, total)
+    return total
+
+
+def get_completed_page(
+    page: int = 1,
+    page_size: int = 20,
+    search_term: Optional[str] = None,
+    after: Optional[int] = None,
+) -> List[VideoToPPTJobDetail]:
+    """获取已完成任务的某一页（不含总数）
+
+    after为上一页最后一条记录的id时使用键集分页，避免深页OFFSET逐行跳过；
+    游标记录不存在（如已被重新处理）时退回OFFSET分页。
+    """
+    with get_database() as db:
+        where_clause, params = _completed_where_clause(search_term, db.fts_enabled)
+        columns = ", ".join(_BROWSE_COLUMNS)
+        cursor = db.connection.cursor()
+        anchor = None
+        if after is not None:
+            anchor = cursor.execute(
+                "SELECT completed_at, id FROM video_ppt_jobs WHERE id = ? AND status = 'completed'",
+                (after,),
+            ).fetchone()
+        if anchor is not None:
+            list_query = f"""
+                SELECT {columns} FROM video_ppt_jobs {where_clause}
+                AND (completed_at, id) < (?, ?)
+                ORDER BY completed_at DESC, id DESC
+                LIMIT ?
+            """
+            rows = cursor.execute(list_query, params + [anchor["completed_at"], anchor["id"], page_size]).fetchall()
+        else:
+            offset = (page - 1) * page_size
+            list_query = f"""
+                SELECT {columns} FROM video_ppt_jobs {where_clause}
+                ORDER BY completed_at DESC, id DESC
+                LIMIT ? OFFSET ?
+            """
+            rows = cursor.execute(list_query, params + [page_size, offset]).fetchall()
+    # 同一页的截图清单并发读取，再逐行构建详情
+    slides_per_row = list(_SLIDES_EXECUTOR.map(_load_slides, [row["slides_json_path"] for row in rows]))
+    return [_row_to_listing_item(row, slides) for row, slides in zip(rows, slides_per_row)]
 
 
 def get_job(job_id: str) -> Optional[VideoToPPTJobDetail]:
+    cached = _job_cache.get((job_id, "detail"))
+    if cached is not None:
+        return cached
     with get_database() as db:
         row = db.get_video_ppt_job_by_job_id(job_id)
     if not row:
         return None
-    return _row_to_detail(row)
+    return _remember_job(job_id, "detail", _row_to_detail(row))
+
+
+# 摘要信息所需的列
+_SUMMARY_COLUMNS = (
+    "id", "job_id", "url", "title", "subtitle", "status", "slide_count",
+    "image_format", "image_quality", "created_at", "updated_at", "started_at",
+    "completed_at", "error_message", "ppt_path", "safe_filename",
+)
+# 播放页额外需要的列（不含stdout/stderr/command等大字段）
+_PLAYER_COLUMNS = _SUMMARY_COLUMNS + (
+    "video_path", "video_files", "video_entries_json", "slides_json_path",
+    "video_duration_seconds", "fps",
+)
+# 浏览页列：摘要列加截图清单与时长，stdout/stderr/command及各JSON列只在详情中返回
+_BROWSE_COLUMNS = _SUMMARY_COLUMNS + ("slides_json_path", "video_duration_seconds", "fps")
+
+
+def _fetch_job_columns(job_id: str, columns: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    with get_database() as db:
+        cursor = db.connection.cursor()
+        row = cursor.execute(
+            f"SELECT {', '.join(columns)} FROM video_ppt_jobs WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def get_job_header(job_id: str) -> Optional[VideoToPPTJobSummary]:
+    """只查询摘要列的任务信息，用于状态检查、下载等不需要详情的场景"""
+    row = _fetch_job_columns(job_id, _SUMMARY_COLUMNS)
+    if not row:
+        return None
+    return _row_to_summary(row)
 
 
-def create_job(payload: VideoToPPTJobCreateRequest, background_tasks: Optional[BackgroundTasks] = None) -> VideoToPPTJobDetail:
+_TIMESTAMP_COLUMNS = ("created_at", "updated_at", "started_at", "completed_at")
+
+
+def list_jobs_lite(limit: Optional[int] = None) -> Dict[str, Any]:
+    """管理页任务列表：只查询摘要列并直接返回dict，不构建Pydantic对象，结构与VideoToPPTJobListResponse一致"""
+    query = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM video_ppt_jobs ORDER BY created_at DESC"
+    params: Tuple[Any, ...] = ()
+    if limit is not None:
+        query += " LIMIT ?"
+        params = (limit,)
+    with get_database() as db:
+        rows = db.connection.execute(query, params).fetchall()
+    items: List[Dict[str, Any]] = []
+    for row in rows:
+        item = dict(row)
+        for column in _TIMESTAMP_COLUMNS:
+            item[column] = _to_datetime(item[column])
+        items.append(item)
+    return {"total": len(items), "items": items}
+
+
+def get_player_job(job_id: str) -> Optional[VideoToPPTJobDetail]:
+    """播放页所需的任务信息：单次查询只取需要的列，任务未完成时不读取截图清单"""
+    cached = _job_cache.get((job_id, "player"))
+    if cached is not None:
+        return cached
+    row = _fetch_job_columns(job_id, _PLAYER_COLUMNS)
+    if not row:
+        return None
+    return _remember_job(job_id, "player", _row_to_detail(row))
+
+
+# 创建任务前的检查合并为一条查询：job_id是否重复、URL是否已有任务、是否有运行中的任务
+_CREATE_JOB_CHECK_SQL = """
+    SELECT
+        EXISTS(SELECT 1 FROM video_ppt_jobs WHERE job_id = ?) AS job_exists,
+        latest.job_id AS url_job_id,
+        latest.status AS url_status,
+        EXISTS(SELECT 1 FROM video_ppt_jobs WHERE status = 'running') AS has_running
+    FROM (SELECT 1)
+    LEFT JOIN (
+        SELECT job_id, status FROM video_ppt_jobs WHERE url = ? ORDER BY created_at DESC LIMIT 1
+    ) AS latest ON 1
+"""
+
+
+def create_job(payload: VideoToPPTJobCreateRequest) -> VideoToPPTJobDetail:
     job_id = payload.job_id or _generate_job_id()
     LOGGER.info("Creating video-to-PPT job job_id=%s url=%s", job_id, payload.url)
     
     with get_database() as db:
-        existing = db.get_video_ppt_job_by_job_id(job_id)
-        if existing:
+        # 立即获取写锁：并发创建时检查与插入串行执行，避免重复URL同时通过检查
+        db.connection.execute("BEGIN IMMEDIATE")
+        check = db.connection.execute(_CREATE_JOB_CHECK_SQL, (job_id, str(payload.url))).fetchone()
+        if check["job_exists"]:
             raise VideoPPTServiceError(f"Job ID already exists: {job_id}")
         
         # 检查URL是否已存在
-        cursor = db.connection.cursor()
-        existing_url = cursor.execute(
-            "SELECT job_id, status FROM video_ppt_jobs WHERE url = ? ORDER BY created_at DESC LIMIT 1",
-            (str(payload.url),)
-        ).fetchone()
-        if existing_url:
-            existing_job_id = existing_url["job_id"]
-            existing_status = existing_url["status"]
+        if check["url_job_id"]:
+            existing_job_id = check["url_job_id"]
+            existing_status = check["url_status"]
             LOGGER.warning("URL already exists: job_id=%s status=%s", existing_job_id, existing_status)
             raise VideoPPTServiceError(
                 f"此视频URL已存在任务（任务ID: {existing_job_id}，状态: {existing_status}）"
             )
         
         # 检查是否有运行中的任务
-        cursor = db.connection.cursor()
-        running_jobs = cursor.execute("SELECT COUNT(*) as count FROM video_ppt_jobs WHERE status = 'running'").fetchone()
-        has_running_job = running_jobs["count"] > 0 if running_jobs else False
+        has_running_job = bool(check["has_running"])
         
         row = db.insert_video_ppt_job(
             {
@@ -349,62 +656,150 @@ def create_job(payload: VideoToPPTJobCreateRequest, background_tasks: Optional[B
             }
         )
 
-    job_detail = _row_to_detail(row)
-    task_payload = payload.dict()
-    task_payload["job_id"] = job_id
-    
     # 如果有运行中的任务，不立即执行，等待队列处理
     if has_running_job:
         LOGGER.info("Job queued (job_id=%s), waiting for running job to complete", job_id)
-    elif background_tasks is not None:
-        LOGGER.debug("Queueing background task for job_id=%s", job_id)
-        background_tasks.add_task(_run_job_task, task_payload)
-    else:
-        LOGGER.debug("Running job synchronously job_id=%s", job_id)
-        _run_job_task(task_payload)
+    _process_next_pending_job()
     
-    return job_detail
+    return _row_to_detail(row)
+
+
+# 进程内单线程任务执行器：常驻线程按创建时间依次处理pending任务，
+# 空闲时等待唤醒（最长WORKER_IDLE_TIMEOUT_SECONDS秒后重新检查），保证同一时间只运行一个任务
+WORKER_IDLE_TIMEOUT_SECONDS = 30.0
+_worker_wakeup = threading.Event()
+_worker_stop = threading.Event()
+_worker_lock = threading.Lock()
+_worker_thread: Optional[threading.Thread] = None
+
+
+def start_job_worker() -> None:
+    """启动任务执行线程（已启动或配置了Celery时不做处理），服务启动时调用"""
+    global _worker_thread
+    if CELERY_BROKER_URL:
+        return
+    with _worker_lock:
+        if _worker_thread is not None and _worker_thread.is_alive():
+            return
+        _worker_stop.clear()
+        _worker_thread = threading.Thread(target=_job_worker_loop, name="video-ppt-worker", daemon=True)
+        _worker_thread.start()
+    LOGGER.info("Video-to-PPT job worker started")
+
+
+def stop_job_worker(timeout: Optional[float] = None) -> None:
+    """通知执行线程退出；正在运行的任务会执行完毕"""
+    _worker_stop.set()
+    _worker_wakeup.set()
+    thread = _worker_thread
+    if thread is not None and timeout:
+        thread.join(timeout)
+
+
+def _claim_next_pending_job() -> Optional[Dict[str, Any]]:
+    """获取最早创建的pending任务"""
+    with get_database() as db:
+        row = db.connection.execute(
+            "SELECT * FROM video_ppt_jobs WHERE status = 'pending' ORDER BY created_at ASC LIMIT 1"
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def _job_worker_loop() -> None:
+    while not _worker_stop.is_set():
+        # 先清除唤醒标记再查询，查询之后到来的通知不会丢失
+        _worker_wakeup.clear()
+        try:
+            job_data = _claim_next_pending_job()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception("Failed to fetch pending job: %s", exc)
+            job_data = None
+        if job_data is None:
+            _worker_wakeup.wait(WORKER_IDLE_TIMEOUT_SECONDS)
+            continue
+
+        job_id = job_data["job_id"]
+        LOGGER.info("Found pending job in queue: %s", job_id)
+        try:
+            _run_job_task(_payload_from_row(job_data))
+        except Exception as exc:  # noqa: BLE001
+            # 保证任务离开pending状态，避免执行器反复处理同一任务
+            LOGGER.exception("Job worker failed to run job %s: %s", job_id, exc)
+            with get_database() as db:
+                current = db.get_video_ppt_job_by_job_id(job_id)
+                if current and current["status"] in ("pending", "running"):
+                    db.mark_video_ppt_job_failed(job_id, f"Unexpected error: {exc}")
+    LOGGER.info("Video-to-PPT job worker stopped")
 
 
 def _process_next_pending_job() -> None:
-    """检查并处理下一个待处理的任务"""
+    """通知执行器处理下一个待处理的任务"""
+    if not CELERY_BROKER_URL:
+        start_job_worker()
+        _worker_wakeup.set()
+        return
+
+    # Celery模式：没有运行中的任务时，将最早的pending任务投递给worker
     with get_database() as db:
-        # 获取最早创建的pending任务
         cursor = db.connection.cursor()
-        cursor.execute("SELECT * FROM video_ppt_jobs WHERE status = 'pending' ORDER BY created_at ASC LIMIT 1")
-        row = cursor.fetchone()
-        if not row:
-            LOGGER.info("No pending jobs in queue")
+        if _has_running_job(cursor):
             return
-        
-        job_data = dict(row)
-        job_id = job_data["job_id"]
-        LOGGER.info("Found pending job in queue: %s", job_id)
-        
-        # 构建payload
-        payload_dict = {
-            "job_id": job_id,
-            "url": job_data["url"],
-            "title": job_data.get("title"),
-            "subtitle": job_data.get("subtitle"),
-            "similarity_threshold": job_data.get("similarity_threshold", 0.95),
-            "min_interval_seconds": job_data.get("min_interval_seconds", 2.0),
-            "skip_first_seconds": job_data.get("skip_first_seconds", 0.0),
-            "fill_mode": job_data.get("fill_mode", True),
-            "image_format": job_data.get("image_format", "jpg"),
-            "image_quality": job_data.get("image_quality", 95),
-            "extra_download_args": job_data.get("extra_download_args"),
-            "file_pattern": job_data.get("file_pattern"),
-        }
-        
-        # 在后台任务中执行
-        import threading
-        thread = threading.Thread(target=_run_job_task, args=(payload_dict,))
-        thread.daemon = True
-        thread.start()
+        cursor.execute("SELECT job_id FROM video_ppt_jobs WHERE status = 'pending' ORDER BY created_at ASC LIMIT 1")
+        row = cursor.fetchone()
+    if not row:
+        LOGGER.info("No pending jobs in queue")
+        return
+    LOGGER.info("Found pending job in queue: %s", row["job_id"])
+    _enqueue_celery_job(row["job_id"])
+
+
+def _payload_from_row(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """由数据库中的任务记录构建_run_job_task所需的payload"""
+    return {
+        "job_id": job_data["job_id"],
+        "url": job_data["url"],
+        "title": job_data.get("title"),
+        "subtitle": job_data.get("subtitle"),
+        "similarity_threshold": job_data.get("similarity_threshold", 0.95),
+        "min_interval_seconds": job_data.get("min_interval_seconds", 2.0),
+        "skip_first_seconds": job_data.get("skip_first_seconds", 0.0),
+        "fill_mode": bool(job_data.get("fill_mode", 1)),
+        "image_format": job_data.get("image_format", "jpg"),
+        "image_quality": job_data.get("image_quality", 95),
+        "extra_download_args": _decode_extra_args(job_data.get("extra_download_args")),
+        "file_pattern": job_data.get("file_pattern"),
+    }
+
+
+def _enqueue_celery_job(job_id: str) -> bool:
+    """配置了CELERY_BROKER_URL时将任务投递给Celery worker，返回是否已投递"""
+    if not CELERY_BROKER_URL:
+        return False
+    from .tasks import process_job
+
+    process_job.delay(job_id)
+    return True
+
+
+def run_job_by_id(job_id: str) -> None:
+    """按任务ID执行任务（供Celery worker调用）"""
+    with get_database() as db:
+        job_data = db.get_video_ppt_job_by_job_id(job_id)
+    if not job_data:
+        LOGGER.warning("Job not found, skip processing: %s", job_id)
+        return
+    if job_data["status"] != "pending":
+        LOGGER.info("Job %s is %s, skip processing", job_id, job_data["status"])
+        return
+    _run_job_task(_payload_from_row(job_data))
 
 
 def _run_job_task(payload_dict: Dict[str, Any]) -> None:
+    """执行单个任务，在任务执行线程（或Celery worker）中同步运行。
+
+    耗时主要在下载子进程与OpenCV抽帧（CPU密集，计算时释放GIL），数据库只有开始/结束两次写入，
+    改为async并不能带来并发收益，反而会阻塞事件循环，因此保持同步实现。
+    """
     job_id = payload_dict["job_id"]
     LOGGER.info("Starting background job %s for %s", job_id, payload_dict.get("url"))
     try:
@@ -450,42 +845,18 @@ def _run_job_task(payload_dict: Dict[str, Any]) -> None:
     final_title = payload_dict.get("title") or extracted_title
     final_subtitle = payload_dict.get("subtitle") or extracted_title
     
-    # 如果提取到了标题且用户未提供，更新数据库
-    if extracted_title and (not payload_dict.get("title") or not payload_dict.get("subtitle")):
-        LOGGER.info("Updating job title/subtitle with extracted title: %s", extracted_title)
-        with get_database() as db:
-            update_data = {}
-            if not payload_dict.get("title"):
-                update_data["title"] = final_title
-            if not payload_dict.get("subtitle"):
-                update_data["subtitle"] = final_subtitle
-            if update_data:
-                # 使用SQL直接更新
-                cursor = db.connection.cursor()
-                cursor.execute(
-                    "UPDATE video_ppt_jobs SET title = COALESCE(?, title), subtitle = COALESCE(?, subtitle) WHERE job_id = ?",
-                    (update_data.get("title"), update_data.get("subtitle"), job_id)
-                )
-                db.connection.commit()
-
-    # 将绝对路径转换为相对路径（相对于部署根目录）
-    from Src.config import BASE_DIR
-    
-    def to_relative_path(abs_path: Path) -> str:
-        """将绝对路径转换为相对路径"""
-        try:
-            return str(abs_path.relative_to(BASE_DIR)).replace("\\", "/")
-        except (ValueError, AttributeError):
-            # 如果无法转换为相对路径，返回原路径
-            return str(abs_path).replace("\\", "/")
-    
+    # 只在完成时按label排序一次，video_files与video_entries均按此顺序保存
+    video_paths = sorted(result.download.video_paths, key=_video_label)
+    # 路径均转换为相对于部署根目录的相对路径后写入数据库
     result_payload = {
-        "job_dir": to_relative_path(result.job_dir),
-        "video_path": to_relative_path(result.download.video_path),
-        "video_files": [to_relative_path(path) for path in result.download.video_paths],
-        "ppt_path": to_relative_path(result.ppt.ppt_path),
-        "slides_json_path": to_relative_path(result.slides.json_path) if result.slides.json_path else None,
-        "screenshots_dir": to_relative_path(result.slides.screenshots_dir),
+        "job_dir": _to_relative_path(result.job_dir),
+        "video_path": _to_relative_path(result.download.video_path),
+        "video_files": [_to_relative_path(path) for path in video_paths],
+        "video_entries": _build_video_entries(video_paths, _to_relative_path),
+        "ppt_path": _to_relative_path(result.ppt.ppt_path),
+        "safe_filename": safe_download_filename(final_title, job_id),
+        "slides_json_path": _to_relative_path(result.slides.json_path) if result.slides.json_path else None,
+        "screenshots_dir": _to_relative_path(result.slides.screenshots_dir),
         "command": result.download.command,
         "stdout": result.download.stdout,
         "stderr": result.download.stderr,
@@ -493,10 +864,19 @@ def _run_job_task(payload_dict: Dict[str, Any]) -> None:
         "fps": result.slides.fps,
         "slide_count": result.ppt.slide_count,
     }
+    # 如果提取到了标题且用户未提供，随完成状态一并写入数据库
+    if extracted_title and (not payload_dict.get("title") or not payload_dict.get("subtitle")):
+        LOGGER.info("Updating job title/subtitle with extracted title: %s", extracted_title)
+        if not payload_dict.get("title"):
+            result_payload["title"] = final_title
+        if not payload_dict.get("subtitle"):
+            result_payload["subtitle"] = final_subtitle
 
     with get_database() as db:
         db.mark_video_ppt_job_completed(job_id, result_payload)
+    _invalidate_job_cache(job_id)
     LOGGER.info("Video-to-PPT job completed: %s", job_id)
     
-    # 任务完成后，处理下一个等待的任务
-    _process_next_pending_job()
+    # Celery模式下由完成的任务投递下一个；进程内执行器会自行循环处理
+    if CELERY_BROKER_URL:
+        _process_next_pending_job()
@@ -30,6 +30,15 @@ if _ytdlp_env:
 else:
     YTDLP_EXECUTABLE = BASE_DIR / "tools" / "yt-dlp.exe"
 
+# Celery配置 - 设置后视频转PPT任务交由外部Celery worker执行，未设置时在服务进程内执行
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "")
+
+# 模板热重载 - 开发时设为1，模板修改后无需重启；生产环境关闭以跳过每次渲染时的mtime检查
+TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "0") == "1"
+
+# 硬件解码 - 设为PyAV/FFmpeg的设备类型（cuda/videotoolbox/vaapi/d3d11va）启用，需安装av；留空使用OpenCV软件解码
+VIDEO_HWACCEL = os.getenv("VIDEO_HWACCEL", "").strip()
+
 # 确保必要目录存在
 for path in [VIDEO_TO_PPT_ROOT, DATABASE_PATH.parent]:
     path.mkdir(parents=True, exist_ok=True)
@@ -4,100 +4,258 @@ import json
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .config import DATABASE_PATH
 
 
+_SCHEMA_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS speeches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_id INTEGER,
+    title TEXT,
+    speaker TEXT,
+    topic TEXT,
+    speech_date TEXT,
+    duration TEXT,
+    video_url TEXT UNIQUE,
+    mp3_path TEXT,
+    raw_transcript_path TEXT,
+    processed_doc_path TEXT,
+    summary TEXT,
+    download_status TEXT DEFAULT 'pending',
+    transcription_status TEXT DEFAULT 'pending',
+    postprocess_status TEXT DEFAULT 'pending',
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS video_ppt_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT UNIQUE,
+    url TEXT NOT NULL,
+    title TEXT,
+    subtitle TEXT,
+    similarity_threshold REAL,
+    min_interval_seconds REAL,
+    skip_first_seconds REAL,
+    fill_mode INTEGER,
+    image_format TEXT,
+    image_quality INTEGER,
+    extra_download_args TEXT,
+    file_pattern TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    job_dir TEXT,
+    error_message TEXT,
+    video_path TEXT,
+    video_files TEXT,
+    video_entries_json TEXT,
+    ppt_path TEXT,
+    safe_filename TEXT,
+    slides_json_path TEXT,
+    screenshots_dir TEXT,
+    command TEXT,
+    stdout TEXT,
+    stderr TEXT,
+    video_duration_seconds REAL,
+    fps REAL,
+    slide_count INTEGER,
+    created_at TEXT,
+    updated_at TEXT,
+    started_at TEXT,
+    completed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS video_ppt_jobs_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO video_ppt_jobs_version (id, version) VALUES (1, 0);
+"""
+
+# 建表语句之后新增的列，旧库启动时通过ALTER TABLE补齐
+_VIDEO_PPT_JOBS_ADDED_COLUMNS = (
+    ("job_dir", "TEXT"),
+    ("video_files", "TEXT"),
+    ("safe_filename", "TEXT"),
+    ("video_entries_json", "TEXT"),
+)
+
+_SCHEMA_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_job_id
+ON video_ppt_jobs(job_id);
+CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_status_created
+ON video_ppt_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_status_completed
+ON video_ppt_jobs(status, completed_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_url
+ON video_ppt_jobs(url, created_at);
+CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_active
+ON video_ppt_jobs(status) WHERE status IN ('pending', 'running');
+"""
+
+# video_ppt_jobs每次写入都递增版本号：Web进程与Celery worker共用同一个库，
+# 上层缓存和浏览页ETag以此为键，任何进程写入后都会失效
+_SCHEMA_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS video_ppt_jobs_version_ai AFTER INSERT ON video_ppt_jobs BEGIN
+    UPDATE video_ppt_jobs_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS video_ppt_jobs_version_au AFTER UPDATE ON video_ppt_jobs BEGIN
+    UPDATE video_ppt_jobs_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS video_ppt_jobs_version_ad AFTER DELETE ON video_ppt_jobs BEGIN
+    UPDATE video_ppt_jobs_version SET version = version + 1 WHERE id = 1;
+END;
+"""
+
+
+_INSERT_VIDEO_PPT_JOB_SQL = """
+INSERT INTO video_ppt_jobs (
+    job_id, url, title, subtitle,
+    similarity_threshold, min_interval_seconds, skip_first_seconds,
+    fill_mode, image_format, image_quality,
+    extra_download_args, file_pattern,
+    status, created_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# 状态流转的固定更新语句：SQL文本不变，可命中sqlite3的预编译语句缓存
+_MARK_DOWNLOADED_SQL = (
+    "UPDATE speeches SET download_status = 'completed', mp3_path = ?, updated_at = ? WHERE video_url = ?"
+)
+_MARK_TRANSCRIBED_SQL = (
+    "UPDATE speeches SET transcription_status = 'completed', raw_transcript_path = ?, updated_at = ? "
+    "WHERE video_url = ?"
+)
+_MARK_POST_PROCESSED_SQL = (
+    "UPDATE speeches SET postprocess_status = 'completed', processed_doc_path = ?, summary = ?, updated_at = ? "
+    "WHERE video_url = ?"
+)
+_MARK_JOB_STARTED_SQL = (
+    "UPDATE video_ppt_jobs SET status = 'running', started_at = ?, error_message = NULL, updated_at = ? "
+    "WHERE job_id = ?"
+)
+_MARK_JOB_FAILED_SQL = (
+    "UPDATE video_ppt_jobs SET status = 'failed', error_message = ?, completed_at = ?, updated_at = ? "
+    "WHERE job_id = ?"
+)
+_MARK_JOB_COMPLETED_SQL = """
+UPDATE video_ppt_jobs SET
+    status = 'completed',
+    job_dir = ?,
+    video_path = ?,
+    video_files = ?,
+    video_entries_json = ?,
+    ppt_path = ?,
+    safe_filename = ?,
+    slides_json_path = ?,
+    screenshots_dir = ?,
+    command = ?,
+    stdout = ?,
+    stderr = ?,
+    video_duration_seconds = ?,
+    fps = ?,
+    slide_count = ?,
+    completed_at = ?,
+    error_message = NULL,
+    title = COALESCE(?, title),
+    subtitle = COALESCE(?, subtitle),
+    updated_at = ?
+WHERE job_id = ?
+"""
+
+
 class SpeechDatabase:
-    def __init__(self, db_path: Path | str = DATABASE_PATH):
+    def __init__(self, db_path: Path | str = DATABASE_PATH, check_same_thread: bool = True):
         self.db_path = Path(db_path)
-        self.connection = sqlite3.connect(self.db_path)
+        # 连接池中的连接会在不同线程间复用，此时需关闭sqlite3的线程检查
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
         self.connection.row_factory = sqlite3.Row
+        self._apply_pragmas()
         self._ensure_schema()
 
+    def _apply_pragmas(self) -> None:
+        """每个连接建立时设置一次：WAL减少fsync并允许读写并发，放大页缓存至64MiB，
+        启用256MiB内存映射读，写锁冲突时最多等待5秒而不是立即报database is locked。"""
+        # 内存数据库不支持WAL
+        if str(self.db_path) != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA cache_size=-65536")
+        self.connection.execute("PRAGMA mmap_size=268435456")
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self.connection.execute("PRAGMA busy_timeout=5000")
+
     def _ensure_schema(self) -> None:
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS speeches (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                video_id INTEGER,
-                title TEXT,
-                speaker TEXT,
-                topic TEXT,
-                speech_date TEXT,
-                duration TEXT,
-                video_url TEXT UNIQUE,
-                mp3_path TEXT,
-                raw_transcript_path TEXT,
-                processed_doc_path TEXT,
-                summary TEXT,
-                download_status TEXT DEFAULT 'pending',
-                transcription_status TEXT DEFAULT 'pending',
-                postprocess_status TEXT DEFAULT 'pending',
-                created_at TEXT,
-                updated_at TEXT
+        # 旧库缺少的列在同一事务内补齐；先读一次表结构，只为缺失的列生成ALTER
+        existing_columns = {
+            row["name"] for row in self.connection.execute("PRAGMA table_info(video_ppt_jobs)")
+        }
+        alter_statements = ""
+        if existing_columns:
+            alter_statements = "".join(
+                f"ALTER TABLE video_ppt_jobs ADD COLUMN {name} {column_type};\n"
+                for name, column_type in _VIDEO_PPT_JOBS_ADDED_COLUMNS
+                if name not in existing_columns
             )
-            """
+        self.connection.executescript(
+            "BEGIN;\n" + _SCHEMA_TABLES_SQL + alter_statements + _SCHEMA_INDEXES_SQL + _SCHEMA_TRIGGERS_SQL + "COMMIT;\n"
         )
+        with self.connection:
+            self._ensure_search_index(self.connection.cursor())
+
+    def _ensure_search_index(self, cursor: sqlite3.Cursor) -> None:
+        """为video_ppt_jobs的title/subtitle/url建立FTS5外部内容索引，并用触发器保持同步。
+
+        标题以中文为主，unicode61会把整段汉字视为一个词，这里使用trigram分词以支持子串检索。
+        SQLite未编译FTS5或版本不支持trigram时fts_enabled为False，调用方退回LIKE查询。
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'video_ppt_jobs_fts'"
+        ).fetchone()
+        try:
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS video_ppt_jobs_fts USING fts5(
+                    title, subtitle, url,
+                    content='video_ppt_jobs', content_rowid='id',
+                    tokenize='trigram'
+                )
+                """
+            )
+        except sqlite3.OperationalError:
+            self.fts_enabled = False
+            return
         cursor.execute(
             """
-            CREATE TABLE IF NOT EXISTS video_ppt_jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id TEXT UNIQUE,
-                url TEXT NOT NULL,
-                title TEXT,
-                subtitle TEXT,
-                similarity_threshold REAL,
-                min_interval_seconds REAL,
-                skip_first_seconds REAL,
-                fill_mode INTEGER,
-                image_format TEXT,
-                image_quality INTEGER,
-                extra_download_args TEXT,
-                file_pattern TEXT,
-                status TEXT NOT NULL DEFAULT 'pending',
-                job_dir TEXT,
-                error_message TEXT,
-                video_path TEXT,
-                ppt_path TEXT,
-                slides_json_path TEXT,
-                screenshots_dir TEXT,
-                command TEXT,
-                stdout TEXT,
-                stderr TEXT,
-                video_duration_seconds REAL,
-                fps REAL,
-                slide_count INTEGER,
-                created_at TEXT,
-                updated_at TEXT,
-                started_at TEXT,
-                completed_at TEXT
-            )
+            CREATE TRIGGER IF NOT EXISTS video_ppt_jobs_fts_ai AFTER INSERT ON video_ppt_jobs BEGIN
+                INSERT INTO video_ppt_jobs_fts(rowid, title, subtitle, url)
+                VALUES (new.id, new.title, new.subtitle, new.url);
+            END
             """
         )
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_job_id
-            ON video_ppt_jobs(job_id)
+            CREATE TRIGGER IF NOT EXISTS video_ppt_jobs_fts_ad AFTER DELETE ON video_ppt_jobs BEGIN
+                INSERT INTO video_ppt_jobs_fts(video_ppt_jobs_fts, rowid, title, subtitle, url)
+                VALUES ('delete', old.id, old.title, old.subtitle, old.url);
+            END
             """
         )
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_video_ppt_jobs_status_created
-            ON video_ppt_jobs(status, created_at)
+            CREATE TRIGGER IF NOT EXISTS video_ppt_jobs_fts_au
+            AFTER UPDATE OF title, subtitle, url ON video_ppt_jobs BEGIN
+                INSERT INTO video_ppt_jobs_fts(video_ppt_jobs_fts, rowid, title, subtitle, url)
+                VALUES ('delete', old.id, old.title, old.subtitle, old.url);
+                INSERT INTO video_ppt_jobs_fts(rowid, title, subtitle, url)
+                VALUES (new.id, new.title, new.subtitle, new.url);
+            END
             """
         )
-        try:
-            cursor.execute("ALTER TABLE video_ppt_jobs ADD COLUMN job_dir TEXT")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute("ALTER TABLE video_ppt_jobs ADD COLUMN video_files TEXT")
-        except sqlite3.OperationalError:
-            pass
-        self.connection.commit()
+        if not exists:
+            # 首次创建时为已有数据建立索引
+            cursor.execute("INSERT INTO video_ppt_jobs_fts(video_ppt_jobs_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
 
     def close(self) -> None:
         self.connection.close()
@@ -106,16 +264,26 @@ class SpeechDatabase:
         return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
     def upsert_video(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        record = self.get_video_by_url(metadata["url"])
         now = self._current_timestamp()
-
-        if record:
-            cursor = self.connection.cursor()
-            cursor.execute(
+        # 单条UPSERT：新URL插入，已存在时只更新元数据，处理状态与created_at保持不变
+        with self.connection:
+            cursor = self.connection.execute(
                 """
-                UPDATE speeches
-                SET video_id = ?, title = ?, speaker = ?, topic = ?, speech_date = ?, duration = ?, updated_at = ?
-                WHERE video_url = ?
+                INSERT INTO speeches (
+                    video_id, title, speaker, topic, speech_date, duration, video_url,
+                    download_status, transcription_status, postprocess_status,
+                    created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', 'pending', 'pending', ?, ?)
+                ON CONFLICT(video_url) DO UPDATE SET
+                    video_id = excluded.video_id,
+                    title = excluded.title,
+                    speaker = excluded.speaker,
+                    topic = excluded.topic,
+                    speech_date = excluded.speech_date,
+                    duration = excluded.duration,
+                    updated_at = excluded.updated_at
+                RETURNING *
                 """,
                 (
                     metadata.get("id"),
@@ -124,37 +292,13 @@ class SpeechDatabase:
                     metadata.get("topic"),
                     metadata.get("speech_date"),
                     metadata.get("duration"),
-                    now,
                     metadata["url"],
+                    now,
+                    now,
                 ),
             )
-            self.connection.commit()
-            return self.get_video_by_url(metadata["url"])
-
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO speeches (
-                video_id, title, speaker, topic, speech_date, duration, video_url,
-                download_status, transcription_status, postprocess_status,
-                created_at, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', 'pending', 'pending', ?, ?)
-            """,
-            (
-                metadata.get("id"),
-                metadata.get("title"),
-                metadata.get("speaker"),
-                metadata.get("topic"),
-                metadata.get("speech_date"),
-                metadata.get("duration"),
-                metadata["url"],
-                now,
-                now,
-            ),
-        )
-        self.connection.commit()
-        return self.get_video_by_url(metadata["url"])
+            row = dict(cursor.fetchone())
+        return row
 
     def get_video_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         cursor = self.connection.cursor()
@@ -169,67 +313,64 @@ class SpeechDatabase:
         columns = ", ".join(f"{key} = ?" for key in fields.keys())
         values = list(fields.values())
         values.append(url)
-        cursor = self.connection.cursor()
-        cursor.execute(f"UPDATE speeches SET {columns} WHERE video_url = ?", values)
-        self.connection.commit()
+        with self.connection:
+            self.connection.execute(f"UPDATE speeches SET {columns} WHERE video_url = ?", values)
 
     def mark_downloaded(self, url: str, mp3_path: Optional[str]) -> None:
-        self.update_video(
-            url,
-            download_status="completed",
-            mp3_path=mp3_path,
-        )
+        with self.connection:
+            self.connection.execute(_MARK_DOWNLOADED_SQL, (mp3_path, self._current_timestamp(), url))
 
     def mark_transcribed(self, url: str, raw_path: Optional[str]) -> None:
-        self.update_video(
-            url,
-            transcription_status="completed",
-            raw_transcript_path=raw_path,
-        )
+        with self.connection:
+            self.connection.execute(_MARK_TRANSCRIBED_SQL, (raw_path, self._current_timestamp(), url))
 
     def mark_post_processed(self, url: str, processed_path: Optional[str], summary: Optional[str]) -> None:
-        self.update_video(
-            url,
-            postprocess_status="completed",
-            processed_doc_path=processed_path,
-            summary=summary,
-        )
+        with self.connection:
+            self.connection.execute(
+                _MARK_POST_PROCESSED_SQL,
+                (processed_path, summary, self._current_timestamp(), url),
+            )
 
     # Video-to-PPT jobs
-    def insert_video_ppt_job(self, job_payload: Dict[str, Any]) -> Dict[str, Any]:
-        now = self._current_timestamp()
-        cursor = self.connection.cursor()
+    def _video_ppt_job_insert_params(self, job_payload: Dict[str, Any], now: str) -> Tuple[Any, ...]:
         extra_args = job_payload.get("extra_download_args")
-        cursor.execute(
-            """
-            INSERT INTO video_ppt_jobs (
-                job_id, url, title, subtitle,
-                similarity_threshold, min_interval_seconds, skip_first_seconds,
-                fill_mode, image_format, image_quality,
-                extra_download_args, file_pattern,
-                status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                job_payload["job_id"],
-                job_payload["url"],
-                job_payload.get("title"),
-                job_payload.get("subtitle"),
-                job_payload.get("similarity_threshold"),
-                job_payload.get("min_interval_seconds"),
-                job_payload.get("skip_first_seconds"),
-                1 if job_payload.get("fill_mode", True) else 0,
-                job_payload.get("image_format"),
-                job_payload.get("image_quality"),
-                json.dumps(extra_args) if extra_args is not None else None,
-                job_payload.get("file_pattern"),
-                job_payload.get("status", "pending"),
-                now,
-                now,
-            ),
+        return (
+            job_payload["job_id"],
+            job_payload["url"],
+            job_payload.get("title"),
+            job_payload.get("subtitle"),
+            job_payload.get("similarity_threshold"),
+            job_payload.get("min_interval_seconds"),
+            job_payload.get("skip_first_seconds"),
+            1 if job_payload.get("fill_mode", True) else 0,
+            job_payload.get("image_format"),
+            job_payload.get("image_quality"),
+            json.dumps(extra_args) if extra_args is not None else None,
+            job_payload.get("file_pattern"),
+            job_payload.get("status", "pending"),
+            now,
+            now,
         )
-        self.connection.commit()
-        return self.get_video_ppt_job_by_job_id(job_payload["job_id"])
+
+    def insert_video_ppt_job(self, job_payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = self._current_timestamp()
+        with self.connection:
+            cursor = self.connection.execute(
+                _INSERT_VIDEO_PPT_JOB_SQL + " RETURNING *",
+                self._video_ppt_job_insert_params(job_payload, now),
+            )
+            # RETURNING直接返回插入后的完整记录，无需再查询一次
+            row = dict(cursor.fetchone())
+        return row
+
+    def insert_video_ppt_jobs_many(self, job_payloads: Iterable[Dict[str, Any]]) -> None:
+        """批量插入任务，整批在一个事务内提交"""
+        now = self._current_timestamp()
+        with self.connection:
+            self.connection.executemany(
+                _INSERT_VIDEO_PPT_JOB_SQL,
+                [self._video_ppt_job_insert_params(payload, now) for payload in job_payloads],
+            )
 
     def get_video_ppt_job_by_job_id(self, job_id: str) -> Optional[Dict[str, Any]]:
         cursor = self.connection.cursor()
@@ -240,53 +381,71 @@ class SpeechDatabase:
         row = cursor.fetchone()
         return dict(row) if row else None
 
-    def list_video_ppt_jobs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        cursor = self.connection.cursor()
-        query = "SELECT * FROM video_ppt_jobs ORDER BY created_at DESC"
-        if limit is not None:
-            query += " LIMIT ?"
-            rows = cursor.execute(query, (limit,)).fetchall()
-        else:
-            rows = cursor.execute(query).fetchall()
-        return [dict(row) for row in rows]
+    def get_video_ppt_jobs_version(self) -> int:
+        """video_ppt_jobs的写入版本号，由触发器维护，跨进程一致"""
+        row = self.connection.execute("SELECT version FROM video_ppt_jobs_version WHERE id = 1").fetchone()
+        return row["version"] if row else 0
 
     def update_video_ppt_job(self, job_id: str, **fields: Any) -> None:
-        if not fields:
+        self.update_video_ppt_jobs_many([(job_id, fields)])
+
+    def update_video_ppt_jobs_many(self, updates: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """批量更新任务：相同列集合的更新合并为一次executemany，整批在一个事务内提交"""
+        now = self._current_timestamp()
+        grouped: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for job_id, fields in updates:
+            if not fields:
+                continue
+            fields = {**fields, "updated_at": now}
+            grouped.setdefault(tuple(fields.keys()), []).append([*fields.values(), job_id])
+        if not grouped:
             return
-        fields["updated_at"] = self._current_timestamp()
-        columns = ", ".join(f"{key} = ?" for key in fields.keys())
-        values = list(fields.values())
-        values.append(job_id)
-        cursor = self.connection.cursor()
-        cursor.execute(
-            f"UPDATE video_ppt_jobs SET {columns} WHERE job_id = ?",
-            values,
-        )
-        self.connection.commit()
+        with self.connection:
+            for keys, rows in grouped.items():
+                columns = ", ".join(f"{key} = ?" for key in keys)
+                self.connection.executemany(
+                    f"UPDATE video_ppt_jobs SET {columns} WHERE job_id = ?",
+                    rows,
+                )
 
     def mark_video_ppt_job_started(self, job_id: str) -> None:
         now = self._current_timestamp()
-        self.update_video_ppt_job(job_id, status="running", started_at=now, error_message=None)
+        with self.connection:
+            self.connection.execute(_MARK_JOB_STARTED_SQL, (now, now, job_id))
 
     def mark_video_ppt_job_completed(self, job_id: str, result_payload: Dict[str, Any]) -> None:
-        fields = {
-            "status": "completed",
-            "job_dir": result_payload.get("job_dir"),
-            "video_path": result_payload.get("video_path"),
-            "video_files": json.dumps(result_payload.get("video_files")) if result_payload.get("video_files") else None,
-            "ppt_path": result_payload.get("ppt_path"),
-            "slides_json_path": result_payload.get("slides_json_path"),
-            "screenshots_dir": result_payload.get("screenshots_dir"),
-            "command": json.dumps(result_payload.get("command")) if result_payload.get("command") else None,
-            "stdout": result_payload.get("stdout"),
-            "stderr": result_payload.get("stderr"),
-            "video_duration_seconds": result_payload.get("video_duration_seconds"),
-            "fps": result_payload.get("fps"),
-            "slide_count": result_payload.get("slide_count"),
-            "completed_at": self._current_timestamp(),
-            "error_message": None,
-        }
-        self.update_video_ppt_job(job_id, **fields)
+        now = self._current_timestamp()
+        video_files = result_payload.get("video_files")
+        video_entries = result_payload.get("video_entries")
+        command = result_payload.get("command")
+        with self.connection:
+            self.connection.execute(
+                _MARK_JOB_COMPLETED_SQL,
+                (
+                    result_payload.get("job_dir"),
+                    result_payload.get("video_path"),
+                    json.dumps(video_files) if video_files else None,
+                    json.dumps(video_entries, ensure_ascii=False) if video_entries else None,
+                    result_payload.get("ppt_path"),
+                    result_payload.get("safe_filename"),
+                    result_payload.get("slides_json_path"),
+                    result_payload.get("screenshots_dir"),
+                    json.dumps(command) if command else None,
+                    result_payload.get("stdout"),
+                    result_payload.get("stderr"),
+                    result_payload.get("video_duration_seconds"),
+                    result_payload.get("fps"),
+                    result_payload.get("slide_count"),
+                    now,
+                    # 下载时提取到的标题：仅在提供时覆盖，与完成状态在同一条UPDATE中写入
+                    result_payload.get("title") or None,
+                    result_payload.get("subtitle") or None,
+                    now,
+                    job_id,
+                ),
+            )
 
     def mark_video_ppt_job_failed(self, job_id: str, error_message: str) -> None:
-        self.update_video_ppt_job(job_id, status="failed", error_message=error_message, completed_at=self._current_timestamp())
+        now = self._current_timestamp()
+        with self.connection:
+            self.connection.execute(_MARK_JOB_FAILED_SQL, (error_message, now, now, job_id))
@@ -2,18 +2,39 @@ from __future__ import annotations
 
 import logging
 import os
+import platform
 import re
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
 from .errors import VideoDownloadError
 from .models import VideoDownloadResult
 
 LOGGER = logging.getLogger(__name__)
 
+# 匹配格式: [2025-10-31 16:06:33.387] - 视频标题: 电影CT揭秘
+_TITLE_RE = re.compile(r"\[\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3}\]\s*-\s*视频标题:\s*(.+)")
+
+
+def _iter_files(root: str, extensions: tuple[str, ...]) -> Iterator[Tuple[str, int]]:
+    """递归遍历目录，产出匹配扩展名的(路径, 字节数)，大小取自DirEntry缓存的stat结果。"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_files(entry.path, extensions)
+                elif entry.is_file() and entry.name.lower().endswith(extensions):
+                    yield entry.path, entry.stat().st_size
+            except OSError:
+                continue
+
 
 class BBDownDownloader:
     """Wrapper around BBDown.exe for downloading bilibili videos."""
@@ -30,6 +51,12 @@ class BBDownDownloader:
         if not self.executable.is_file():
             raise FileNotFoundError(f"BBDown path is not a file: {self.executable}")
 
+        # 平台相关的子进程参数只计算一次
+        is_windows = platform.system() == "Windows"
+        self._output_encoding = "gbk" if is_windows else "utf-8"  # Windows下BBDown使用GBK编码
+        # Windows下添加CREATE_NO_WINDOW标志
+        self._creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if is_windows else 0
+
     def download(
         self,
         url: str,
@@ -59,19 +86,15 @@ class BBDownDownloader:
         
         try:
             # 使用简单的subprocess.run调用
-            import platform
             kwargs = {
                 "capture_output": True,
                 "text": True,
-                "encoding": "gbk" if platform.system() == "Windows" else "utf-8",  # Windows下BBDown使用GBK编码
+                "encoding": self._output_encoding,
                 "errors": "ignore",
                 "check": False,
+                "creationflags": self._creationflags,
             }
-            
-            # Windows下添加CREATE_NO_WINDOW标志
-            if platform.system() == "Windows":
-                kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            
+
             completed = subprocess.run(command, **kwargs)
         except (OSError, PermissionError) as exc:
             LOGGER.error("Failed to start BBDown. Executable: %s, Command: %s, Error: %s", 
@@ -129,34 +152,33 @@ class BBDownDownloader:
         )
 
     def _locate_video_files(self, directory: Path) -> List[Path]:
-        candidates: List[Path] = []
-        for path in directory.rglob("*"):
-            if path.is_file() and path.suffix.lower() in self.VIDEO_EXTENSIONS:
-                # 排除0字节文件（下载失败或未完成）
-                if path.stat().st_size > 0:
-                    candidates.append(path)
+        # 单次遍历：每个文件只stat一次，大小随路径一起保存用于排序
+        candidates = [
+            (size, Path(path)) for path, size in _iter_files(os.fspath(directory), self.VIDEO_EXTENSIONS) if size > 0
+        ]
 
         if not candidates:
             LOGGER.warning("No valid video files found in %s", directory)
             return []
 
         # 按文件大小排序，选择最大的文件（通常是主视频）
-        candidates.sort(key=lambda p: p.stat().st_size, reverse=True)
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        largest_size, largest_path = candidates[0]
         LOGGER.info(
             "Found %d video file(s). Largest: %s (size: %d bytes)",
             len(candidates),
-            candidates[0].name,
-            candidates[0].stat().st_size,
+            largest_path.name,
+            largest_size,
         )
-        return candidates
+        return [path for _, path in candidates]
 
     def _extract_video_title(self, stdout: str) -> str | None:
         """从BBDown的stdout中提取视频标题"""
         if not stdout:
             return None
-        
-        # 匹配格式: [2025-10-31 16:06:33.387] - 视频标题: 电影CT揭秘
-        match = re.search(r'\[\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3}\]\s*-\s*视频标题:\s*(.+)', stdout)
+
+        # 标题在解析视频信息时输出，位于下载进度之前，因此从头搜索而不是只看末尾
+        match = _TITLE_RE.search(stdout)
         if match:
             title = match.group(1).strip()
             return title if title else None
@@ -1,26 +1,179 @@
 from __future__ import annotations
 
-import json
-import hashlib
 import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
+import orjson
+
+try:  # 可选：安装PyAV后可使用FFmpeg硬件解码
+    import av
+    from av.codec.hwaccel import HWAccel
+except ImportError:  # pragma: no cover - 未安装时回退到OpenCV解码
+    av = None
+    HWAccel = None
+
+try:  # 可选：安装PyTurboJPEG及libjpeg-turbo后用SIMD编码器保存JPEG
+    from turbojpeg import TJPF_BGR, TurboJPEG
+
+    _TURBO_JPEG: Optional[TurboJPEG] = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # pragma: no cover - 未安装或找不到动态库时使用OpenCV编码
+    TJPF_BGR = None
+    _TURBO_JPEG = None
+
+from Src.config import BASE_DIR
 
 from .errors import SlideExtractionError
 from .models import SlideExtractionResult, SlideInfo
 
 LOGGER = logging.getLogger(__name__)
 
+# 64位差值哈希：9×8灰度图相邻像素比较，相似度阈值0.95对应允许3位差异
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+# 超过该时长的视频按段并行扫描，短视频进程启动开销不划算
+PARALLEL_MIN_DURATION_SECONDS = 600.0
+MAX_EXTRACT_WORKERS = 4
+# 并行分段时每段向前与上一段重叠的最小间隔倍数：在重叠部分找到与顺序扫描状态一致的帧后，
+# 该段之后的结果与顺序扫描完全相同
+SEGMENT_OVERLAP_INTERVALS = 3
+SAVE_WORKERS = 2
+# 需跳过的帧超过该时长时直接定位而不是逐帧grab：定位要从前一个关键帧解码到目标帧，
+# 跳过段短于常见关键帧间隔（2~5秒）时并不比grab省
+SEEK_MIN_SECONDS = 5.0
+JPEG_SUFFIXES = frozenset({".jpg", ".jpeg"})
+
+
+_BASE_DIR_PREFIX = str(BASE_DIR).replace("\\", "/").rstrip("/") + "/"
+
+
+def _to_relative_path(abs_path: Path) -> str:
+    """将绝对路径转换为相对部署根目录的路径，不在根目录下时原样返回"""
+    path_str = str(abs_path).replace("\\", "/")
+    if path_str.startswith(_BASE_DIR_PREFIX):
+        return path_str[len(_BASE_DIR_PREFIX):]
+    return path_str
+
 
 def _format_time(seconds: float) -> str:
     seconds_int = max(int(seconds), 0)
     return str(timedelta(seconds=seconds_int))
 
 
+def _scan_segment(
+    settings: Dict[str, Any], scan_start: int, keep_from: int, end_frame: Optional[int]
+) -> Optional[List[Tuple[int, Optional[float], Optional[bytes], Tuple[int, ...]]]]:
+    """子进程入口：从scan_start开始（无参考帧）扫描到end_frame（不含），返回候选幻灯片
+    (帧号, 相似度, 编码数据, 帧尺寸)。
+
+    keep_from之前是与上一段重叠的部分，只返回帧号用于父进程对齐扫描状态，不编码图片。
+    无法精确定位到起始帧时返回None。
+    """
+    extractor = SlideExtractor(**settings)
+    if not extractor._open_video():
+        raise SlideExtractionError(f"Failed to open video: {extractor.video_path}")
+    try:
+        if extractor._seek_to_frame(scan_start) != scan_start:
+            return None
+        suffix = f".{extractor.image_format}"
+        records = []
+        for frame_index, frame, similarity in extractor._iter_new_slides(scan_start, end_frame):
+            data = extractor._encode_frame(frame, suffix) if frame_index >= keep_from else None
+            records.append((frame_index, similarity, data, frame.shape))
+        return records
+    finally:
+        extractor._close_video()
+
+
+def _scan_states(
+    saved_frames: Sequence[int], start: int, end: int, min_interval_frames: int, skip_frames: int
+) -> List[int]:
+    """按_iter_new_slides的规则还原[start, end)内每帧的处理方式：0跳过，1比较未保存，2保存。"""
+    saved = set(saved_frames)
+    last_saved = max((frame for frame in saved_frames if frame < start), default=None)
+    states: List[int] = []
+    for frame_index in range(start, end):
+        if frame_index in saved:
+            states.append(2)
+            last_saved = frame_index
+        elif frame_index >= skip_frames and (last_saved is None or frame_index - last_saved >= min_interval_frames):
+            states.append(1)
+        else:
+            states.append(0)
+    return states
+
+
+class _PyAVCapture:
+    """Minimal cv2.VideoCapture-compatible reader backed by PyAV hardware decoding."""
+
+    def __init__(self, video_path: str, device_type: str) -> None:
+        self._container = av.open(video_path, hwaccel=HWAccel(device_type=device_type, allow_software_fallback=True))
+        self._stream = self._container.streams.video[0]
+        self._stream.thread_type = "AUTO"
+        self._frames = self._container.decode(self._stream)
+        self._pending = None
+        self._position = 0
+
+    def isOpened(self) -> bool:
+        return self._container is not None
+
+    def get(self, prop: int) -> float:
+        stream = self._stream
+        fps = float(stream.average_rate or 0)
+        if prop == cv2.CAP_PROP_FPS:
+            return fps
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            if stream.frames:
+                return float(stream.frames)
+            # 部分容器不记录帧数，按时长估算
+            if stream.duration is not None and stream.time_base is not None:
+                return float(stream.duration * stream.time_base) * fps
+            return (self._container.duration or 0) / av.time_base * fps
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(stream.codec_context.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(stream.codec_context.height)
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._position)
+        return 0.0
+
+    def set(self, prop: int, value: float) -> bool:
+        # 不支持精确定位，调用方会回退到逐帧grab
+        return False
+
+    def grab(self) -> bool:
+        try:
+            self._pending = next(self._frames)
+        except (StopIteration, av.error.FFmpegError):
+            self._pending = None
+            return False
+        self._position += 1
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        # 只有需要比较的帧才转换为BGR数组
+        if self._pending is None:
+            return False, None
+        return True, self._pending.to_ndarray(format="bgr24")
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def release(self) -> None:
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+
 class SlideExtractor:
     """Detect slide changes in training videos and export screenshots."""
 
@@ -33,24 +186,35 @@ class SlideExtractor:
         skip_first_seconds: float = 0.0,
         image_format: str = "jpg",
         image_quality: int = 95,
+        hwaccel: str | None = None,
     ) -> None:
         self.video_path = Path(video_path)
+        # 解析一次绝对路径，打开视频（包括并行分段时）直接复用
+        self._video_path_str = str(self.video_path.resolve())
         self.output_dir = Path(output_dir)
         self.similarity_threshold = similarity_threshold
         self.min_interval_seconds = min_interval_seconds
         self.skip_first_seconds = skip_first_seconds
         self.image_format = image_format.lower().lstrip(".")
         self.image_quality = int(image_quality)
+        self.hwaccel = hwaccel or None
 
-        self.cap: Optional[cv2.VideoCapture] = None
+        self.cap: Optional[cv2.VideoCapture | _PyAVCapture] = None
         self.fps: float = 0.0
         self.total_frames: int = 0
         self.width: int = 0
         self.height: int = 0
         self.duration_seconds: float = 0.0
+        # 扫描中长跳过段是否可以直接定位；硬件解码或定位不精确时关闭，退回逐帧grab
+        self._seek_enabled = False
 
-        self.last_frame_hash: Optional[str] = None
-        self.last_frame_features: Optional[np.ndarray] = None
+        self.last_frame_hash: Optional[int] = None
+        # 相似度阈值换算为允许的汉明距离，similarity = 1 - 距离/总位数
+        self._max_hash_distance = int((1.0 - similarity_threshold) * HASH_BITS)
+        self._gray_buffer: Optional[np.ndarray] = None
+        # 哈希计算的中间缓冲区按帧复用，避免每帧分配临时数组
+        self._hash_small = np.empty((HASH_SIZE, HASH_SIZE + 1), dtype=np.uint8)
+        self._hash_bits = np.empty((HASH_SIZE, HASH_SIZE), dtype=bool)
 
     def extract(self, json_path: Path | None = None) -> SlideExtractionResult:
         if not self.video_path.exists():
@@ -61,53 +225,24 @@ class SlideExtractor:
         if not self._open_video():
             raise SlideExtractionError(f"Failed to open video: {self.video_path}")
 
-        slides: List[SlideInfo] = []
-        min_interval_frames = max(int(self.min_interval_seconds * self.fps), 1)
-        skip_frames = int(self.skip_first_seconds * self.fps)
-
-        frame_index = 0
-        last_saved_frame = -min_interval_frames
-
         try:
-            while True:
-                success, frame = self.cap.read()
-                if not success:
-                    break
-
-                timestamp_seconds = frame_index / self.fps if self.fps > 0 else 0.0
-
-                if frame_index < skip_frames:
-                    frame_index += 1
-                    continue
-
-                if frame_index - last_saved_frame < min_interval_frames:
-                    frame_index += 1
-                    continue
-
-                is_new_slide, similarity = self._is_new_slide(frame)
-                if not is_new_slide:
-                    frame_index += 1
-                    continue
-
-                slide_index = len(slides) + 1
-                filename = f"slide_{slide_index:04d}.{self.image_format}"
-                slide_path = self.output_dir / filename
-                self._save_frame(frame, slide_path)
-
-                height, width = frame.shape[:2]
-                slide = SlideInfo(
-                    index=slide_index,
-                    filename=filename,
-                    path=slide_path,
-                    timestamp_seconds=timestamp_seconds,
-                    timestamp_text=_format_time(timestamp_seconds),
-                    width=width,
-                    height=height,
-                    similarity=similarity,
-                )
-                slides.append(slide)
-                last_saved_frame = frame_index
-                frame_index += 1
+            slides = self._extract_parallel()
+            if slides is None:
+                slides = []
+                skip_frames = self._skip_frames()
+                start_frame = self._seek_to_frame(skip_frames)
+                if start_frame != skip_frames:
+                    self._seek_enabled = False
+                # 图片编码写盘交给后台线程（cv2.imwrite会释放GIL），解码无需等待编码完成；
+                # read()每次返回新数组，提交后不会被覆盖，无需拷贝
+                with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as save_pool:
+                    pending: List[Future] = []
+                    for frame_index, frame, similarity in self._iter_new_slides(start_frame, None):
+                        slide = self._make_slide(len(slides) + 1, frame_index, frame.shape, similarity)
+                        pending.append(save_pool.submit(self._save_frame, frame, slide.path))
+                        slides.append(slide)
+                    for future in pending:
+                        future.result()
         finally:
             self._close_video()
 
@@ -127,21 +262,172 @@ class SlideExtractor:
         LOGGER.info("Extracted %s PPT slides from %s", len(slides), self.video_path)
         return result
 
+    def _min_interval_frames(self) -> int:
+        return max(int(self.min_interval_seconds * self.fps), 1)
+
+    def _skip_frames(self) -> int:
+        return int(self.skip_first_seconds * self.fps)
+
+    def _iter_new_slides(
+        self, frame_index: int, end_frame: Optional[int]
+    ) -> Iterator[Tuple[int, np.ndarray, Optional[float]]]:
+        """从当前读取位置扫描到end_frame（不含，None表示读到结尾），产出(帧号, 帧, 相似度)。"""
+        min_interval_frames = self._min_interval_frames()
+        skip_frames = self._skip_frames()
+        seek_min_frames = max(int(SEEK_MIN_SECONDS * self.fps), 1)
+        last_saved_frame = -min_interval_frames
+
+        while end_frame is None or frame_index < end_frame:
+            # 跳过段（片头、保存后的最小间隔内）不做比较：较长时直接定位到段尾，
+            # 否则只grab不retrieve，省去像素转换和拷贝
+            next_frame = max(skip_frames, last_saved_frame + min_interval_frames)
+            if frame_index < next_frame:
+                # 帧数估算可能偏大，接近结尾时不定位，避免定位失败后回到开头重读
+                if (
+                    self._seek_enabled
+                    and next_frame - frame_index >= seek_min_frames
+                    and next_frame < self.total_frames
+                ):
+                    if end_frame is not None:
+                        next_frame = min(next_frame, end_frame)
+                    landed = self._seek_to_frame(next_frame)
+                    if landed != next_frame:
+                        # 定位不精确时已回到开头，之后逐帧grab追上
+                        LOGGER.debug("Exact seek unsupported, falling back to grab: %s", self.video_path)
+                        self._seek_enabled = False
+                    frame_index = landed
+                    continue
+                if not self.cap.grab():
+                    break
+                frame_index += 1
+                continue
+
+            success, frame = self.cap.read()
+            if not success:
+                break
+
+            is_new_slide, similarity = self._is_new_slide(frame)
+            if is_new_slide:
+                yield frame_index, frame, similarity
+                last_saved_frame = frame_index
+            frame_index += 1
+
+    def _make_slide(
+        self, slide_index: int, frame_index: int, shape: Tuple[int, ...], similarity: Optional[float]
+    ) -> SlideInfo:
+        timestamp_seconds = frame_index / self.fps if self.fps > 0 else 0.0
+        filename = f"slide_{slide_index:04d}.{self.image_format}"
+        height, width = shape[:2]
+        return SlideInfo(
+            index=slide_index,
+            filename=filename,
+            path=self.output_dir / filename,
+            timestamp_seconds=timestamp_seconds,
+            timestamp_text=_format_time(timestamp_seconds),
+            width=width,
+            height=height,
+            similarity=similarity,
+        )
+
+    def _parallel_workers(self) -> int:
+        # 硬件解码不支持精确定位；Celery prefork等守护进程内不能再创建子进程
+        if self.hwaccel or multiprocessing.current_process().daemon:
+            return 1
+        if self.duration_seconds < PARALLEL_MIN_DURATION_SECONDS or self.total_frames <= 0:
+            return 1
+        return max(min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS), 1)
+
+    def _extract_parallel(self) -> Optional[List[SlideInfo]]:
+        """按时长切分为多段并行扫描；不适用、任一段无法精确定位或重叠部分无法对齐时返回None，
+        由调用方顺序扫描。"""
+        workers = self._parallel_workers()
+        if workers < 2:
+            return None
+
+        min_interval_frames = self._min_interval_frames()
+        skip_frames = self._skip_frames()
+        overlap = max(SEGMENT_OVERLAP_INTERVALS * min_interval_frames, int(self.fps), 1)
+        span = self.total_frames - skip_frames
+        if span < workers * overlap * 2:
+            return None
+        bounds = [skip_frames + span * i // workers for i in range(workers + 1)]
+        bounds[-1] = None  # 最后一段读到结尾，帧数估算不准时也不会漏帧
+        # 第一段从片头后开始，与顺序扫描一致；之后各段提前overlap帧开始，重叠部分只用于对齐
+        scan_starts = [bounds[0]] + [bounds[i] - overlap for i in range(1, workers)]
+        settings = {
+            "video_path": self._video_path_str,
+            "output_dir": self.output_dir,
+            "similarity_threshold": self.similarity_threshold,
+            "min_interval_seconds": self.min_interval_seconds,
+            "skip_first_seconds": self.skip_first_seconds,
+            "image_format": self.image_format,
+            "image_quality": self.image_quality,
+        }
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_scan_segment, settings, scan_starts[i], bounds[i], bounds[i + 1])
+                    for i in range(workers)
+                ]
+                segments = [future.result() for future in futures]
+        except Exception as exc:
+            LOGGER.warning("Parallel slide extraction failed, falling back to sequential scan: %s", exc)
+            return None
+        if any(segment is None for segment in segments):
+            LOGGER.info("Video does not support exact seeking, using sequential scan: %s", self.video_path)
+            return None
+
+        # 逐段合并：段内扫描从无参考帧开始，状态与顺序扫描不同；在重叠部分找到两者处理方式
+        # 相同（都保存，或都比较但未保存）的帧，此后扫描状态一致，取该段keep_from之后的结果
+        slides: List[SlideInfo] = []
+        saved_frames: List[int] = []
+        for segment_index, records in enumerate(segments):
+            keep_from = bounds[segment_index]
+            if segment_index > 0:
+                scan_start = scan_starts[segment_index]
+                merged_states = _scan_states(saved_frames, scan_start, keep_from, min_interval_frames, skip_frames)
+                segment_states = _scan_states(
+                    [record[0] for record in records], scan_start, keep_from, min_interval_frames, skip_frames
+                )
+                if not any(
+                    merged == segment != 0 for merged, segment in zip(merged_states, segment_states)
+                ):
+                    LOGGER.info("Parallel segments could not be aligned, using sequential scan: %s", self.video_path)
+                    return None
+            for frame_index, similarity, data, shape in records:
+                if frame_index < keep_from:
+                    continue
+                slide = self._make_slide(len(slides) + 1, frame_index, shape, similarity)
+                slide.path.write_bytes(data)
+                slides.append(slide)
+                saved_frames.append(frame_index)
+
+        LOGGER.info("Scanned %s in %d parallel segments", self.video_path, workers)
+        return slides
+
     def _open_video(self) -> bool:
-        video_path_str = str(self.video_path.resolve())
-        self.cap = cv2.VideoCapture(video_path_str, cv2.CAP_FFMPEG)
+        video_path_str = self._video_path_str
+        self.cap = self._open_hw_capture(video_path_str)
+        # PyAV读取器不支持定位，set会直接返回False
+        self._seek_enabled = self.cap is None
+        if self.cap is None:
+            self.cap = cv2.VideoCapture(video_path_str, cv2.CAP_FFMPEG)
         if not self.cap.isOpened():
             self.cap = cv2.VideoCapture(video_path_str)
         if not self.cap.isOpened():
             LOGGER.error("Cannot open video: %s", self.video_path)
             return False
 
-        fps = self.cap.get(cv2.CAP_PROP_FPS)
-        self.fps = fps if fps and fps > 0 else 25.0
-        self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        self.duration_seconds = self.total_frames / self.fps if self.fps > 0 else 0.0
+        cap_get = self.cap.get
+        fps = cap_get(cv2.CAP_PROP_FPS)
+        fps = fps if fps and fps > 0 else 25.0
+        total_frames = int(cap_get(cv2.CAP_PROP_FRAME_COUNT))
+        self.fps = fps
+        self.total_frames = total_frames
+        self.width = int(cap_get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(cap_get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.duration_seconds = total_frames / fps
 
         LOGGER.debug(
             "Video opened: fps=%s total_frames=%s size=%sx%s duration=%ss",
@@ -154,75 +440,81 @@ class SlideExtractor:
 
         return True
 
+    def _open_hw_capture(self, video_path: str) -> Optional[_PyAVCapture]:
+        if not self.hwaccel:
+            return None
+        if av is None:
+            LOGGER.warning("VIDEO_HWACCEL=%s is set but PyAV is not installed, using OpenCV decode", self.hwaccel)
+            return None
+        try:
+            return _PyAVCapture(video_path, self.hwaccel)
+        except Exception as exc:
+            LOGGER.warning("Hardware decode unavailable (%s), using OpenCV decode: %s", self.hwaccel, exc)
+            return None
+
+    def _seek_to_frame(self, target: int) -> int:
+        """尝试直接定位到目标帧，返回实际所在的帧号；容器不支持精确定位时回退到从头读取。"""
+        if target <= 0:
+            return 0
+        if self.cap.set(cv2.CAP_PROP_POS_FRAMES, target) and int(self.cap.get(cv2.CAP_PROP_POS_FRAMES)) == target:
+            return target
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return 0
+
     def _close_video(self) -> None:
         if self.cap:
             self.cap.release()
             self.cap = None
 
-    def _compute_frame_hash(self, frame: np.ndarray) -> str:
-        resized = cv2.resize(frame, (64, 64))
-        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
-        return hashlib.md5(gray.tobytes()).hexdigest()
-
-    def _compute_frame_features(self, frame: np.ndarray) -> np.ndarray:
-        resized = cv2.resize(frame, (128, 128))
-        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
-        gray = cv2.equalizeHist(gray)
-        return gray.astype("float32").flatten() / 255.0
-
-    def _compute_similarity(self, features_a: np.ndarray, features_b: np.ndarray) -> float:
-        numerator = float(np.dot(features_a, features_b))
-        denominator = float(np.linalg.norm(features_a) * np.linalg.norm(features_b))
-        if denominator == 0.0:
-            return 0.0
-        return max(min(numerator / denominator, 1.0), 0.0)
+    def _compute_frame_hash(self, frame: np.ndarray) -> int:
+        # 差值哈希：缩小到(N+1)×N灰度图，比较相邻像素得到N×N位指纹
+        self._gray_buffer = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buffer)
+        small = cv2.resize(
+            self._gray_buffer,
+            (HASH_SIZE + 1, HASH_SIZE),
+            dst=self._hash_small,
+            interpolation=cv2.INTER_AREA,
+        )
+        np.greater(small[:, 1:], small[:, :-1], out=self._hash_bits)
+        return int.from_bytes(np.packbits(self._hash_bits).tobytes(), "big")
 
     def _is_new_slide(self, frame: np.ndarray) -> Tuple[bool, Optional[float]]:
         current_hash = self._compute_frame_hash(frame)
-        if self.last_frame_hash == current_hash:
-            return False, 1.0
-
-        current_features = self._compute_frame_features(frame)
-        if self.last_frame_features is None:
-            self.last_frame_hash = current_hash
-            self.last_frame_features = current_features
+        last_hash = self.last_frame_hash
+        self.last_frame_hash = current_hash
+        if last_hash is None:
             return True, None
 
-        similarity = self._compute_similarity(self.last_frame_features, current_features)
-        if similarity >= self.similarity_threshold:
-            self.last_frame_hash = current_hash
-            self.last_frame_features = current_features
-            return False, similarity
-
-        self.last_frame_hash = current_hash
-        self.last_frame_features = current_features
-        return True, similarity
+        distance = (current_hash ^ last_hash).bit_count()
+        similarity = 1.0 - distance / HASH_BITS
+        return distance > self._max_hash_distance, similarity
+
+    def _encode_params(self, suffix: str) -> List[int]:
+        if suffix in JPEG_SUFFIXES:
+            return [int(cv2.IMWRITE_JPEG_QUALITY), self.image_quality]
+        if suffix == ".png":
+            return [int(cv2.IMWRITE_PNG_COMPRESSION), 3]
+        return []
+
+    def _encode_frame(self, frame: np.ndarray, suffix: str) -> bytes:
+        if _TURBO_JPEG is not None and suffix in JPEG_SUFFIXES:
+            return _TURBO_JPEG.encode(frame, quality=self.image_quality, pixel_format=TJPF_BGR)
+        success, encoded = cv2.imencode(suffix, frame, self._encode_params(suffix))
+        if not success:
+            raise SlideExtractionError(f"Failed to encode frame as {suffix}")
+        return encoded.tobytes()
 
     def _save_frame(self, frame: np.ndarray, path: Path) -> None:
-        params: List[int] = []
         suffix = path.suffix.lower()
-        if suffix in {".jpg", ".jpeg"}:
-            params = [int(cv2.IMWRITE_JPEG_QUALITY), self.image_quality]
-        elif suffix == ".png":
-            params = [int(cv2.IMWRITE_PNG_COMPRESSION), 3]
-
-        if not cv2.imwrite(str(path), frame, params):
+        if _TURBO_JPEG is not None and suffix in JPEG_SUFFIXES:
+            path.write_bytes(self._encode_frame(frame, suffix))
+            return
+        if not cv2.imwrite(str(path), frame, self._encode_params(suffix)):
             raise SlideExtractionError(f"Failed to write frame to {path}")
 
     def _write_json(self, json_path: Path, result: SlideExtractionResult) -> None:
-        # 将绝对路径转换为相对路径（相对于部署根目录）
-        from Src.config import BASE_DIR
-        
-        def to_relative_path(abs_path: Path) -> str:
-            """将绝对路径转换为相对路径"""
-            try:
-                return str(abs_path.relative_to(BASE_DIR)).replace("\\", "/")
-            except (ValueError, AttributeError):
-                # 如果无法转换为相对路径，返回原路径
-                return str(abs_path).replace("\\", "/")
-        
         payload = {
-            "video_path": to_relative_path(result.video_path),
+            "video_path": _to_relative_path(result.video_path),
             "fps": result.fps,
             "total_frames": result.total_frames,
             "duration_seconds": result.duration_seconds,
@@ -230,7 +522,7 @@ class SlideExtractor:
                 {
                     "index": slide.index,
                     "filename": slide.filename,
-                    "path": to_relative_path(slide.path),
+                    "path": _to_relative_path(slide.path),
                     "timestamp_seconds": slide.timestamp_seconds,
                     "timestamp": slide.timestamp_text,
                     "width": slide.width,
@@ -242,4 +534,5 @@ class SlideExtractor:
         }
 
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        # orjson直接输出UTF-8字节，非ASCII字符不转义，与原先ensure_ascii=False的格式一致
+        json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
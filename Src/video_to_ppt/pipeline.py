@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
-import re
-from dataclasses import dataclass, field
+import queue
+import shutil
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, List, Sequence
 from uuid import uuid4
 
 from .downloader import BBDownDownloader
@@ -18,6 +21,12 @@ from .ytdlp_downloader import YtDlpDownloader
 
 LOGGER = logging.getLogger(__name__)
 
+# 阶段之间的队列容量：已下载待提取的任务最多两个，避免磁盘上堆积过多待处理视频
+STAGE_QUEUE_SIZE = 2
+
+# 文件名中不允许出现的字符统一替换为下划线
+_UNSAFE_FILENAME_CHARS = str.maketrans({char: "_" for char in '\\/:*?"<>|'})
+
 
 @dataclass(frozen=True)
 class PipelineConfig:
@@ -27,6 +36,8 @@ class PipelineConfig:
     default_bbdown_args: Sequence[str] = field(default_factory=tuple)
     default_ytdlp_args: Sequence[str] = field(default_factory=tuple)
     keep_download_video: bool = True
+    video_hwaccel: str | None = None  # PyAV硬件解码设备类型，如cuda/videotoolbox/vaapi/d3d11va
+    download_workers: int = 3  # run_many中同时进行的下载数
 
 
 @dataclass
@@ -44,6 +55,57 @@ class PipelineOptions:
     file_pattern: str | None = None
 
 
+@dataclass
+class _JobState:
+    """Per-job state handed from one pipeline stage to the next."""
+
+    url: str
+    options: PipelineOptions
+    job_id: str
+    job_dir: Path
+    download: VideoDownloadResult | None = None
+    slides: SlideExtractionResult | None = None
+    ppt: PPTBuildResult | None = None
+
+    @property
+    def download_dir(self) -> Path:
+        return self.job_dir / "download"
+
+    @property
+    def images_dir(self) -> Path:
+        return self.job_dir / "slides" / "images"
+
+    @property
+    def ppt_dir(self) -> Path:
+        return self.job_dir / "ppt"
+
+    def result(self) -> PipelineResult:
+        return PipelineResult(
+            job_id=self.job_id,
+            job_dir=self.job_dir,
+            video_url=self.url,
+            download=self.download,
+            slides=self.slides,
+            ppt=self.ppt,
+        )
+
+
+class _StageLatch:
+    """Counts the running workers of one stage; the last one to exit closes the next stage."""
+
+    def __init__(self, workers: int, outbox: queue.Queue | None) -> None:
+        self._remaining = workers
+        self._outbox = outbox
+        self._lock = threading.Lock()
+
+    def worker_exited(self) -> None:
+        with self._lock:
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last and self._outbox is not None:
+            self._outbox.put(None)
+
+
 class VideoToPPTPipeline:
     """High-level orchestrator that converts bilibili videos into PPT decks."""
 
@@ -70,69 +132,173 @@ class VideoToPPTPipeline:
                 LOGGER.warning("Failed to initialize yt-dlp: %s", e)
 
     def run(self, url: str, options: PipelineOptions | None = None) -> PipelineResult:
+        state = self._prepare_job(url, options or PipelineOptions())
+        try:
+            self._stage_download(state)
+            self._stage_extract(state)
+            self._stage_build(state)
+        except Exception as exc:
+            error = self._wrap_error(exc)
+            if error is exc:
+                raise
+            raise error from exc
+        finally:
+            self._finish_job(state)
+        return state.result()
+
+    def run_many(
+        self,
+        urls: Sequence[str],
+        options: Sequence[PipelineOptions | None] | None = None,
+    ) -> List[Future]:
+        """流水线方式处理多个视频：下载、提取、生成PPT三个阶段通过有界队列衔接。
+
+        下载由config.download_workers个线程并发进行，提取和生成PPT各一个线程，
+        提取截图时其他任务仍在下载。阻塞至全部任务结束，
+        返回与urls一一对应的Future，result()得到PipelineResult或抛出该任务的异常。
+        """
+        per_job_options = list(options) if options is not None else [None] * len(urls)
+        if len(per_job_options) != len(urls):
+            raise VideoToPPTError("options must match urls one-to-one.")
+
+        futures: List[Future] = []
+        stages = (
+            (self._stage_download, max(self.config.download_workers, 1)),
+            (self._stage_extract, 1),
+            (self._stage_build, 1),
+        )
+        queues: List[queue.Queue] = [queue.Queue(maxsize=STAGE_QUEUE_SIZE) for _ in stages]
+        workers: List[threading.Thread] = []
+        for i, (stage, count) in enumerate(stages):
+            latch = _StageLatch(count, queues[i + 1] if i + 1 < len(queues) else None)
+            stage_name = stage.__name__.removeprefix("_stage_")
+            workers.extend(
+                threading.Thread(
+                    target=self._stage_worker,
+                    args=(stage, queues[i], queues[i + 1] if i + 1 < len(queues) else None, latch),
+                    name=f"video-to-ppt-{stage_name}-{n}",
+                    daemon=True,
+                )
+                for n in range(count)
+            )
+        for worker in workers:
+            worker.start()
+
+        for url, opts in zip(urls, per_job_options):
+            future: Future = Future()
+            futures.append(future)
+            try:
+                # 每个任务使用独立的选项副本：下载阶段会回填title/subtitle
+                state = self._prepare_job(url, replace(opts) if opts else PipelineOptions())
+            except Exception as exc:
+                future.set_exception(self._wrap_error(exc))
+                continue
+            queues[0].put((state, future))
+
+        queues[0].put(None)
+        for worker in workers:
+            worker.join()
+        return futures
+
+    def _stage_worker(
+        self,
+        stage: Callable[[_JobState], None],
+        inbox: queue.Queue,
+        outbox: queue.Queue | None,
+        latch: _StageLatch,
+    ) -> None:
+        try:
+            while True:
+                item = inbox.get()
+                try:
+                    if item is None:
+                        # 结束标记放回队列，同一阶段的其他线程也能收到
+                        inbox.put(None)
+                        return
+                    state, future = item
+                    try:
+                        stage(state)
+                        if outbox is not None:
+                            outbox.put(item)
+                            continue
+                        self._finish_job(state)
+                        future.set_result(state.result())
+                    except Exception as exc:
+                        self._fail_job(state, future, exc)
+                finally:
+                    inbox.task_done()
+        finally:
+            # 无论以何种方式退出都计数，本阶段最后一个线程向下游传递结束标记，
+            # 避免下游线程和run_many的join永久阻塞
+            latch.worker_exited()
+
+    def _fail_job(self, state: _JobState, future: Future, exc: Exception) -> None:
+        try:
+            self._finish_job(state)
+        except Exception:
+            LOGGER.exception("Failed to clean up job %s", state.job_id)
+        future.set_exception(self._wrap_error(exc))
+
+    def _prepare_job(self, url: str, opts: PipelineOptions) -> _JobState:
         if not url:
             raise VideoToPPTError("Video URL is required.")
 
-        opts = options or PipelineOptions()
         job_id = opts.job_id or self._generate_job_id()
         job_dir = self.config.workspace_root / job_id
-        download_dir = job_dir / "download"
-        slides_dir = job_dir / "slides"
-        images_dir = slides_dir / "images"
-        ppt_dir = job_dir / "ppt"
+        state = _JobState(url=url, options=opts, job_id=job_id, job_dir=job_dir)
 
-        for path in [download_dir, images_dir, ppt_dir]:
+        for path in [state.download_dir, state.images_dir, state.ppt_dir]:
             path.mkdir(parents=True, exist_ok=True)
 
         LOGGER.info("Starting video-to-PPT pipeline (job=%s)", job_id)
+        return state
 
-        try:
-            download_result = self._download_video(
-                url=url,
-                download_dir=download_dir,
-                file_pattern=opts.file_pattern or job_id,
-                extra_args=opts.extra_download_args,
-            )
-            
-            # 如果用户未提供title/subtitle，使用从BBDown提取的标题
-            if download_result.video_title:
-                if not opts.title:
-                    opts.title = download_result.video_title
-                    LOGGER.info("Using extracted video title for PPT: %s", opts.title)
-                if not opts.subtitle:
-                    opts.subtitle = download_result.video_title
-                    LOGGER.info("Using extracted video title for PPT subtitle: %s", opts.subtitle)
-            
-            slides_result = self._extract_slides(
-                download_result=download_result,
-                images_dir=images_dir,
-                slides_json_path=slides_dir / "slides.json",
-                options=opts,
-            )
-            ppt_result = self._build_ppt(
-                slides_result=slides_result,
-                ppt_dir=ppt_dir,
-                options=opts,
-            )
-        except (VideoToPPTError, VideoDownloadError, SlideExtractionError, PPTBuildError):
-            # Pass through typed pipeline errors
-            raise
-        except Exception as exc:
-            LOGGER.exception("Pipeline failed unexpectedly: %s", exc)
-            raise VideoToPPTError(f"Unexpected pipeline error: {exc}") from exc
-        finally:
-            if not self.config.keep_download_video:
-                self._cleanup_download(download_dir)
+    def _stage_download(self, state: _JobState) -> None:
+        opts = state.options
+        download_result = self._download_video(
+            url=state.url,
+            download_dir=state.download_dir,
+            file_pattern=opts.file_pattern or state.job_id,
+            extra_args=opts.extra_download_args,
+        )
+        state.download = download_result
 
-        return PipelineResult(
-            job_id=job_id,
-            job_dir=job_dir,
-            video_url=url,
-            download=download_result,
-            slides=slides_result,
-            ppt=ppt_result,
+        # 如果用户未提供title/subtitle，使用从BBDown提取的标题
+        if download_result.video_title:
+            if not opts.title:
+                opts.title = download_result.video_title
+                LOGGER.info("Using extracted video title for PPT: %s", opts.title)
+            if not opts.subtitle:
+                opts.subtitle = download_result.video_title
+                LOGGER.info("Using extracted video title for PPT subtitle: %s", opts.subtitle)
+
+    def _stage_extract(self, state: _JobState) -> None:
+        state.slides = self._extract_slides(
+            download_result=state.download,
+            images_dir=state.images_dir,
+            slides_json_path=state.job_dir / "slides" / "slides.json",
+            options=state.options,
+        )
+
+    def _stage_build(self, state: _JobState) -> None:
+        state.ppt = self._build_ppt(
+            slides_result=state.slides,
+            ppt_dir=state.ppt_dir,
+            options=state.options,
         )
 
+    def _finish_job(self, state: _JobState) -> None:
+        if not self.config.keep_download_video:
+            self._cleanup_download(state.download_dir)
+
+    @staticmethod
+    def _wrap_error(exc: Exception) -> Exception:
+        if isinstance(exc, (VideoToPPTError, VideoDownloadError, SlideExtractionError, PPTBuildError)):
+            # Pass through typed pipeline errors
+            return exc
+        LOGGER.error("Pipeline failed unexpectedly: %s", exc, exc_info=exc)
+        return VideoToPPTError(f"Unexpected pipeline error: {exc}")
+
     def _download_video(
         self,
         url: str,
@@ -197,6 +363,7 @@ class VideoToPPTPipeline:
             skip_first_seconds=options.skip_first_seconds,
             image_format=options.image_format,
             image_quality=options.image_quality,
+            hwaccel=self.config.video_hwaccel,
         )
         try:
             return extractor.extract(json_path=slides_json_path)
@@ -237,17 +404,15 @@ class VideoToPPTPipeline:
 
     @staticmethod
     def _safe_filename(name: str, suffix: str) -> str:
-        sanitized = re.sub(r'[\\/:*?"<>|]', "_", name).strip("_")
+        sanitized = name.translate(_UNSAFE_FILENAME_CHARS).strip("_")
         if not sanitized:
             sanitized = "output"
         return f"{sanitized}{suffix}"
 
     def _cleanup_download(self, download_dir: Path) -> None:
-        for path in sorted(download_dir.glob("**/*"), reverse=True):
-            try:
-                if path.is_file():
-                    path.unlink(missing_ok=True)
-                elif path.is_dir():
-                    path.rmdir()
-            except OSError:
-                LOGGER.debug("Skip cleanup for %s", path)
+        # 整个下载目录一次性删除后重建空目录，删除失败的条目直接跳过
+        shutil.rmtree(download_dir, ignore_errors=True)
+        try:
+            download_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            LOGGER.debug("Skip cleanup for %s", download_dir)
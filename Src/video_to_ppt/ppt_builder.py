@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import io
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Sequence, Tuple
+from typing import Iterable, Sequence, Tuple
+from xml.sax.saxutils import quoteattr
 
-from PIL import Image
 from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.opc.packuri import PackURI
+from pptx.slide import SlideLayout
 from pptx.util import Inches
 
 from .errors import PPTBuildError
@@ -13,6 +21,42 @@ from .models import PPTBuildResult, SlideInfo
 
 LOGGER = logging.getLogger(__name__)
 
+# 只含一张图片的空白幻灯片，fast_mode下直接作为slide部件写入，不构建python-pptx对象树
+_PICTURE_SLIDE_XML = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    "<p:cSld><p:spTree>"
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+    '<p:pic><p:nvPicPr><p:cNvPr id="2" name="Picture 1" descr={descr}/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+    "</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+)
+
+EMU_PER_INCH = 914400
+# 可用区域的最小边长（0.01英寸），边距过大时避免除零
+MIN_AVAILABLE_EMU = 9144
+
+# 读取图片文件和缩小图片的线程数
+IO_WORKERS = 8
+
+# 源图超过按嵌入DPI算出的像素尺寸这么多倍时才缩小重新编码
+DOWNSCALE_RATIO = 1.5
+DOWNSCALE_JPEG_QUALITY = 85
+
+_IMAGE_CONTENT_TYPES = {
+    ".jpg": CT.JPEG,
+    ".jpeg": CT.JPEG,
+    ".png": CT.PNG,
+    ".bmp": CT.BMP,
+    ".gif": CT.GIF,
+    ".webp": "image/webp",
+}
+
 
 class PPTBuilder:
     """Create PPT files from extracted slide images."""
@@ -21,12 +65,23 @@ class PPTBuilder:
         self,
         fill_mode: bool = True,
         margin_inches: float = 0.3,
+        fast_mode: bool = True,
+        image_dpi: int | None = 150,
     ) -> None:
         self.fill_mode = fill_mode
+        self.fast_mode = fast_mode
+        # 嵌入图片的目标DPI，None表示原图直接嵌入
+        self.image_dpi = image_dpi
         self.margin_inches = max(float(margin_inches), 0.0)
         # 16:9 比例 (标准1920x1080): 10 x 5.625 inches
         self.slide_width = Inches(10)
         self.slide_height = Inches(5.625)
+        # 每张幻灯片都要用到的EMU尺寸预先算好，_calculate_bounds中只做整数运算
+        self._slide_width_emu = int(self.slide_width)
+        self._slide_height_emu = int(self.slide_height)
+        margin_emu = int(self.margin_inches * EMU_PER_INCH)
+        self._available_width_emu = max(self._slide_width_emu - 2 * margin_emu, MIN_AVAILABLE_EMU)
+        self._available_height_emu = max(self._slide_height_emu - 2 * margin_emu, MIN_AVAILABLE_EMU)
 
     def build(
         self,
@@ -48,10 +103,23 @@ class PPTBuilder:
         if title:
             self._add_title_slide(presentation, title, subtitle)
 
-        for slide_info in slides:
-            self._add_image_slide(presentation, slide_info)
-
-        presentation.save(str(output_path))
+        blank_layout = presentation.slide_layouts[6]  # Blank layout
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            bounds = self._calculate_all_bounds(slides)
+            # 图片字节在线程池中预读（必要时缩小），按顺序取用
+            blobs = pool.map(self._load_image_blob, slides, bounds)
+            if self.fast_mode:
+                self._add_image_slides_fast(presentation, blank_layout, slides, bounds, blobs)
+            else:
+                for slide_info, slide_bounds, blob in zip(slides, bounds, blobs):
+                    self._add_image_slide(presentation, blank_layout, slide_bounds, blob)
+
+        # 先完整写入内存，再一次性写临时文件并原子替换，避免中途失败留下损坏的PPT
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        tmp_path.write_bytes(buffer.getbuffer())
+        os.replace(tmp_path, output_path)
         LOGGER.info("PPT generated: %s (slides=%s)", output_path, len(slides))
         return PPTBuildResult(ppt_path=output_path, slide_count=len(slides))
 
@@ -67,22 +135,70 @@ class PPTBuilder:
             if subtitle_shape:
                 subtitle_shape.text = subtitle
 
-    def _add_image_slide(self, presentation: Presentation, slide_info: SlideInfo) -> None:
-        layout = presentation.slide_layouts[6]  # Blank layout
+    def _add_image_slide(
+        self,
+        presentation: Presentation,
+        layout: SlideLayout,
+        bounds: Tuple[int, int, int, int],
+        blob: bytes,
+    ) -> None:
         slide = presentation.slides.add_slide(layout)
-        left, top, width, height = self._calculate_bounds(slide_info.path)
-        slide.shapes.add_picture(str(slide_info.path), left, top, width=width, height=height)
-
-    def _calculate_bounds(self, image_path: Path) -> Tuple[int, int, int, int]:
-        with Image.open(image_path) as img:
-            img_width, img_height = img.size
-
-        margin = Inches(self.margin_inches)
-        available_width = max(self.slide_width - 2 * margin, Inches(0.01))
-        available_height = max(self.slide_height - 2 * margin, Inches(0.01))
+        left, top, width, height = bounds
+        slide.shapes.add_picture(io.BytesIO(blob), left, top, width=width, height=height)
 
-        width_ratio = available_width / img_width
-        height_ratio = available_height / img_height
+    def _add_image_slides_fast(
+        self,
+        presentation: Presentation,
+        layout: SlideLayout,
+        slides: Sequence[SlideInfo],
+        bounds: Sequence[Tuple[int, int, int, int]],
+        blobs: Iterable[bytes],
+    ) -> None:
+        """直接生成幻灯片XML和图片部件并挂到演示文稿上。
+
+        add_picture每次都会计算图片SHA1并遍历整个包查找重复图片和可用部件名，
+        幻灯片较多时接近O(N^2)；这里部件名按序号直接分配，图片字节原样写入。
+        """
+        package = presentation.part.package
+        layout_part = layout.part
+        sld_id_lst = presentation.slides._sldIdLst
+        first_number = len(sld_id_lst) + 1
+
+        for offset, (slide_info, blob, slide_bounds) in enumerate(zip(slides, blobs, bounds)):
+            number = first_number + offset
+            suffix = slide_info.path.suffix.lower()
+            image_part = Part(
+                PackURI(f"/ppt/media/slide-image{number}{suffix}"),
+                _IMAGE_CONTENT_TYPES.get(suffix, CT.JPEG),
+                package,
+                blob,
+            )
+            slide_part = Part(PackURI(f"/ppt/slides/slide{number}.xml"), CT.PML_SLIDE, package)
+            slide_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+            rid = slide_part.relate_to(image_part, RT.IMAGE)
+
+            left, top, width, height = slide_bounds
+            slide_part.blob = _PICTURE_SLIDE_XML.format(
+                descr=quoteattr(slide_info.filename),
+                rid=rid,
+                left=left,
+                top=top,
+                cx=width,
+                cy=height,
+            ).encode("utf-8")
+            sld_id_lst.add_sldId(presentation.part.relate_to(slide_part, RT.SLIDE))
+
+    def _calculate_all_bounds(self, slides: Sequence[SlideInfo]) -> list[Tuple[int, int, int, int]]:
+        return [self._calculate_bounds(slide_info) for slide_info in slides]
+
+    def _calculate_bounds(self, slide_info: SlideInfo) -> Tuple[int, int, int, int]:
+        # 尺寸在提取截图时已记录（slides.json中的width/height），不再读取图片文件
+        img_width, img_height = slide_info.width, slide_info.height
+        if img_width <= 0 or img_height <= 0:
+            raise PPTBuildError(f"Missing image size for slide: {slide_info.filename}")
+
+        width_ratio = self._available_width_emu / img_width
+        height_ratio = self._available_height_emu / img_height
 
         if self.fill_mode:
             scale_ratio = max(width_ratio, height_ratio)
@@ -92,7 +208,39 @@ class PPTBuilder:
         display_width = int(img_width * scale_ratio)
         display_height = int(img_height * scale_ratio)
 
-        left = int((self.slide_width - display_width) / 2)
-        top = int((self.slide_height - display_height) / 2)
+        left = int((self._slide_width_emu - display_width) / 2)
+        top = int((self._slide_height_emu - display_height) / 2)
 
         return left, top, display_width, display_height
+
+    def _load_image_blob(self, slide_info: SlideInfo, bounds: Tuple[int, int, int, int]) -> bytes:
+        """读取图片字节；源图远大于显示所需像素时缩小重新编码，减少打包体积和保存耗时。"""
+        blob = slide_info.path.read_bytes()
+        if not self.image_dpi:
+            return blob
+
+        _, _, display_width, display_height = bounds
+        target_width = max(display_width * self.image_dpi // EMU_PER_INCH, 1)
+        target_height = max(display_height * self.image_dpi // EMU_PER_INCH, 1)
+        if (
+            slide_info.width <= target_width * DOWNSCALE_RATIO
+            and slide_info.height <= target_height * DOWNSCALE_RATIO
+        ):
+            return blob
+
+        # 只有需要缩小时才用到Pillow
+        from PIL import Image
+
+        with Image.open(io.BytesIO(blob)) as img:
+            image_format = img.format or "JPEG"
+            resized = img.resize((target_width, target_height), Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        # 保持原格式，与部件扩展名和内容类型一致
+        if image_format == "JPEG":
+            resized.save(buffer, image_format, quality=DOWNSCALE_JPEG_QUALITY, optimize=True)
+        else:
+            resized.save(buffer, image_format, optimize=True)
+        if buffer.tell() >= len(blob):
+            return blob
+        return buffer.getvalue()
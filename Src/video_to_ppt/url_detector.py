@@ -2,6 +2,13 @@ from __future__ import annotations
 
 import re
 from enum import Enum
+from functools import lru_cache
+
+# B站URL特征
+_BILIBILI_RE = re.compile(r"bilibili\.com|b23\.tv|acg\.tv", re.IGNORECASE)
+
+# YouTube URL特征
+_YOUTUBE_RE = re.compile(r"youtube\.com|youtu\.be|youtube-nocookie\.com", re.IGNORECASE)
 
 
 class VideoSource(Enum):
@@ -11,6 +18,7 @@ class VideoSource(Enum):
     UNKNOWN = "unknown"
 
 
+@lru_cache(maxsize=1024)
 def detect_video_source(url: str) -> VideoSource:
     """
     检测视频URL的来源
@@ -21,29 +29,10 @@ def detect_video_source(url: str) -> VideoSource:
     Returns:
         VideoSource枚举值
     """
-    url_lower = url.lower()
-    
-    # B站URL特征
-    bilibili_patterns = [
-        r'bilibili\.com',
-        r'b23\.tv',
-        r'acg\.tv',
-    ]
-    
-    # YouTube URL特征
-    youtube_patterns = [
-        r'youtube\.com',
-        r'youtu\.be',
-        r'youtube-nocookie\.com',
-    ]
-    
-    for pattern in bilibili_patterns:
-        if re.search(pattern, url_lower):
-            return VideoSource.BILIBILI
-    
-    for pattern in youtube_patterns:
-        if re.search(pattern, url_lower):
-            return VideoSource.YOUTUBE
-    
-    return VideoSource.UNKNOWN
+    if _BILIBILI_RE.search(url):
+        return VideoSource.BILIBILI
 
+    if _YOUTUBE_RE.search(url):
+        return VideoSource.YOUTUBE
+
+    return VideoSource.UNKNOWN
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 import logging
-import re
+import os
+import platform
 import subprocess
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Sequence
+from typing import IO, Deque, List, Sequence
 
+from .downloader import _iter_files
 from .errors import VideoDownloadError
 from .models import VideoDownloadResult
 
 LOGGER = logging.getLogger(__name__)
 
+# 下载前由yt-dlp打印的标题行前缀，用于从stdout中区分标题和最终文件路径
+TITLE_PRINT_PREFIX = "[video-title] "
+
+# stdout/stderr各保留的最后行数，写入任务记录
+OUTPUT_TAIL_LINES = 1000
+
+
+def _drain_lines(stream: IO[str], sink: Deque[str]) -> None:
+    for line in stream:
+        sink.append(line.rstrip("\r\n"))
+
 
 class YtDlpDownloader:
     """Wrapper around yt-dlp for downloading YouTube videos."""
@@ -28,6 +44,11 @@ class YtDlpDownloader:
         if not self.executable.is_file():
             raise FileNotFoundError(f"yt-dlp path is not a file: {self.executable}")
 
+        # Windows下添加CREATE_NO_WINDOW标志，平台检测只做一次
+        self._creationflags = (
+            getattr(subprocess, "CREATE_NO_WINDOW", 0) if platform.system() == "Windows" else 0
+        )
+
     def download(
         self,
         url: str,
@@ -38,10 +59,6 @@ class YtDlpDownloader:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 先获取视频元数据（包括标题）
-        video_title = self._fetch_video_metadata(url)
-        LOGGER.info("Fetched video title: %s", video_title)
-
         # yt-dlp输出模板 - 使用 %(title)s 确保文件名包含标题
         # 如果提供了file_pattern，使用它；否则使用 "%(title)s.%(ext)s"
         if file_pattern:
@@ -56,6 +73,7 @@ class YtDlpDownloader:
             "-o", output_template,
             "--no-playlist",  # 不下载播放列表
             "-f", "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",  # 优先MP4
+            "--print", f"before_dl:{TITLE_PRINT_PREFIX}%(title)s",  # 下载前打印标题，无需单独查询元数据
             "--print", "after_move:filepath",  # 打印最终文件路径
         ]
         
@@ -66,58 +84,75 @@ class YtDlpDownloader:
         if extra_args:
             command.extend(extra_args)
 
+        # 墙钟时间只用于结果中的时间戳，耗时用单调时钟计算，不受系统时间调整影响
         started_at = datetime.utcnow()
+        started_ns = time.monotonic_ns()
         LOGGER.info("Downloading video via yt-dlp: %s", url)
         LOGGER.info("yt-dlp command: %s", " ".join(command))
         
         try:
-            import platform
-            kwargs = {
-                "capture_output": True,
-                "text": True,
-                "encoding": "utf-8",
-                "errors": "ignore",
-                "check": False,
-            }
-            
-            # Windows下添加CREATE_NO_WINDOW标志
-            if platform.system() == "Windows":
-                kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            
-            completed = subprocess.run(command, **kwargs)
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="ignore",
+                creationflags=self._creationflags,
+            )
         except (OSError, PermissionError) as exc:
             LOGGER.error("Failed to start yt-dlp. Executable: %s, Command: %s, Error: %s", 
                         self.executable, command, exc)
             raise VideoDownloadError(f"Failed to start yt-dlp: {exc}") from exc
 
+        # 边下载边读取输出：stderr由后台线程读取，两个管道都只保留最后若干行，长时间下载时内存不随输出增长
+        stderr_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_reader = threading.Thread(target=_drain_lines, args=(process.stderr, stderr_tail), daemon=True)
+        stderr_reader.start()
+
+        stdout_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        video_title: str | None = None
+        with process:
+            for line in process.stdout:
+                line = line.rstrip("\r\n")
+                LOGGER.debug("yt-dlp: %s", line)
+                stdout_tail.append(line)
+                if line.startswith(TITLE_PRINT_PREFIX):
+                    video_title = line[len(TITLE_PRINT_PREFIX):].strip() or None
+            stderr_reader.join()
+        returncode = process.returncode
+
+        elapsed_seconds = (time.monotonic_ns() - started_ns) / 1e9
         completed_at = datetime.utcnow()
 
-        stdout = completed.stdout or ""
-        stderr = completed.stderr or ""
+        stdout = "\n".join(stdout_tail)
+        stderr = "\n".join(stderr_tail)
 
-        # 记录完整的输出信息
+        LOGGER.info("Fetched video title: %s", video_title)
+
+        # 记录输出信息（各保留最后若干行）
         LOGGER.info("yt-dlp stdout:\n%s", stdout)
         if stderr:
             LOGGER.warning("yt-dlp stderr:\n%s", stderr)
-        LOGGER.info("yt-dlp exit code: %s", completed.returncode)
+        LOGGER.info("yt-dlp exit code: %s (elapsed %.1fs)", returncode, elapsed_seconds)
 
         # 尝试定位视频文件
         video_paths = self._locate_video_files(output_dir)
         
         # 即使yt-dlp返回错误码，只要找到了有效的视频文件就继续
         if not video_paths:
-            if completed.returncode != 0:
-                LOGGER.error("yt-dlp failed (code=%s) and no video file found", completed.returncode)
+            if returncode != 0:
+                LOGGER.error("yt-dlp failed (code=%s) and no video file found", returncode)
                 raise VideoDownloadError(
-                    f"yt-dlp exited with code {completed.returncode}. stderr: {stderr.strip()}"
+                    f"yt-dlp exited with code {returncode}. stderr: {stderr.strip()}"
                 )
             else:
                 raise VideoDownloadError("Download finished but no video file was found.")
         
         # 如果找到了视频文件但yt-dlp返回了错误码，记录警告但继续处理
-        if completed.returncode != 0:
+        if returncode != 0:
             LOGGER.warning("yt-dlp returned error code %s but video file was found, continuing...", 
-                          completed.returncode)
+                          returncode)
 
         primary_video_path = video_paths[0]
         LOGGER.info("Video downloaded: %s", primary_video_path)
@@ -132,80 +167,22 @@ class YtDlpDownloader:
             stderr=stderr,
             started_at=started_at,
             completed_at=completed_at,
-            video_title=video_title,  # 使用预先获取的标题
+            video_title=video_title,  # 下载时打印的标题
         )
 
     def _locate_video_files(self, directory: Path) -> List[Path]:
-        candidates: List[Path] = []
-        for path in directory.rglob("*"):
-            if path.is_file() and path.suffix.lower() in self.VIDEO_EXTENSIONS:
-                # 排除0字节文件（下载失败或未完成）
-                if path.stat().st_size > 0:
-                    candidates.append(path)
+        # 单次遍历：每个文件只stat一次，大小随路径一起保存用于排序
+        candidates = [
+            (size, Path(path)) for path, size in _iter_files(os.fspath(directory), self.VIDEO_EXTENSIONS) if size > 0
+        ]
 
         if not candidates:
             LOGGER.warning("No valid video files found in %s", directory)
             return []
 
         # 按文件大小排序，选择最大的文件（通常是主视频）
-        candidates.sort(key=lambda p: p.stat().st_size, reverse=True)
-        LOGGER.info("Found %d video file(s), selected: %s (size: %d bytes)", 
-                   len(candidates), candidates[0].name, candidates[0].stat().st_size)
-        return candidates
-
-    def _fetch_video_metadata(self, url: str) -> str | None:
-        """
-        使用 --print-json 获取视频元数据
-        
-        Args:
-            url: 视频URL
-            
-        Returns:
-            视频标题，如果获取失败则返回None
-        """
-        try:
-            import json
-            import platform
-            
-            # 构建获取元数据的命令
-            command = [
-                str(self.executable),
-                url,
-                "--skip-download",  # 不下载视频
-                "--print-json",  # 输出JSON格式的元数据
-                "--no-playlist",  # 不处理播放列表
-            ]
-            
-            kwargs = {
-                "capture_output": True,
-                "text": True,
-                "encoding": "utf-8",
-                "errors": "ignore",
-                "check": False,
-                "timeout": 30,  # 30秒超时
-            }
-            
-            if platform.system() == "Windows":
-                kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            
-            LOGGER.debug("Fetching metadata with command: %s", " ".join(command))
-            result = subprocess.run(command, **kwargs)
-            
-            if result.returncode == 0 and result.stdout:
-                # 解析JSON输出
-                try:
-                    metadata = json.loads(result.stdout)
-                    title = metadata.get("title")
-                    if title:
-                        LOGGER.info("Successfully fetched video title from metadata: %s", title)
-                        return title
-                except json.JSONDecodeError as e:
-                    LOGGER.warning("Failed to parse JSON metadata: %s", e)
-            else:
-                LOGGER.warning("Failed to fetch metadata (code=%s): %s", result.returncode, result.stderr)
-                
-        except Exception as e:
-            LOGGER.warning("Error fetching video metadata: %s", e)
-        
-        return None
-
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        largest_size, largest_path = candidates[0]
+        LOGGER.info("Found %d video file(s), selected: %s (size: %d bytes)",
+                   len(candidates), largest_path.name, largest_size)
+        return [path for _, path in candidates]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from Src.video_to_ppt.extractor import SlideExtractor
+
+FPS = 5
+FRAME_COUNT = 600
+# 切换点落在4段分段边界（150/300/450）附近，157号幻灯片短于最小间隔
+SLIDE_CHANGES = (0, 50, 147, 157, 300, 400, 451)
+
+
+def _write_video(path: Path) -> None:
+    rng = np.random.default_rng(0)
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), FPS, (320, 180))
+    images = []
+    for _ in SLIDE_CHANGES:
+        image = np.zeros((180, 320, 3), np.uint8)
+        for _ in range(12):
+            x, y = (int(value) for value in rng.integers(0, 280, 2))
+            width, height = (int(value) for value in rng.integers(10, 40, 2))
+            color = tuple(int(value) for value in rng.integers(0, 255, 3))
+            cv2.rectangle(image, (x, y % 160), (x + width, y % 160 + height), color, -1)
+        images.append(image)
+    current = 0
+    for frame_index in range(FRAME_COUNT):
+        while current + 1 < len(SLIDE_CHANGES) and frame_index >= SLIDE_CHANGES[current + 1]:
+            current += 1
+        writer.write(images[current])
+    writer.release()
+
+
+def _slide_frames(video_path: Path, output_dir: Path) -> list[int]:
+    result = SlideExtractor(video_path, output_dir, min_interval_seconds=2.0).extract()
+    return [round(slide.timestamp_seconds * FPS) for slide in result.slides]
+
+
+def test_parallel_scan_matches_sequential_across_segment_boundaries(tmp_path, monkeypatch):
+    video_path = tmp_path / "slides.avi"
+    _write_video(video_path)
+
+    monkeypatch.setattr(SlideExtractor, "_parallel_workers", lambda self: 1)
+    sequential = _slide_frames(video_path, tmp_path / "sequential")
+
+    monkeypatch.setattr(SlideExtractor, "_parallel_workers", lambda self: 4)
+    parallel = _slide_frames(video_path, tmp_path / "parallel")
+
+    assert sequential == list(SLIDE_CHANGES)
+    assert parallel == sequential